@@ -4,12 +4,20 @@ Core API client for interacting with PWHL data sources.
 import time
 import json
 import logging
+import threading
 import requests
 from typing import Dict, Any, Optional
 
 from pwhl_scraper.api.endpoints import API_ENDPOINTS
 from pwhl_scraper.config import API_CONFIG
 
+# orjson decodes responses several times faster when it is installed; its
+# JSONDecodeError subclasses json.JSONDecodeError, so error handling is shared
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,6 +44,7 @@ class PWHLApiClient:
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
         self.base_url = API_CONFIG["HOCKEYTECH_BASE_URL"]
         self.default_params = {
             "key": API_CONFIG["HOCKEYTECH_KEY"],
@@ -43,18 +52,20 @@ class PWHLApiClient:
         }
 
     def _respect_rate_limit(self):
-        if self.last_request_time == 0:
-            self.last_request_time = time.time()
-            return
+        # Serialize request starts so concurrent callers still honour the rate limit
+        with self._rate_limit_lock:
+            if self.last_request_time == 0:
+                self.last_request_time = time.time()
+                return
 
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+            current_time = time.time()
+            time_since_last_request = current_time - self.last_request_time
 
-        if time_since_last_request < self.rate_limit:
-            sleep_time = self.rate_limit - time_since_last_request
-            time.sleep(sleep_time)
+            if time_since_last_request < self.rate_limit:
+                sleep_time = self.rate_limit - time_since_last_request
+                time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
+            self.last_request_time = time.time()
 
     def _get(self, url: str, params: Dict[str, Any]) -> Optional[requests.Response]:
         """
@@ -144,7 +155,7 @@ class PWHLApiClient:
             text = text[1:-1]
 
         try:
-            data = json.loads(text)
+            data = _json_loads(text)
 
             if self.cache is not None and data and cache_key:
                 self.cache[cache_key] = data
@@ -4,6 +4,7 @@ Database management for PWHL Scraper.
 
 from pwhl_scraper.database.db_manager import (
     setup_database,
+    create_schema,
     create_connection,
     execute_query,
     execute_many,
@@ -15,6 +16,7 @@ from pwhl_scraper.database.models import get_table_schema
 
 __all__ = [
     'setup_database',
+    'create_schema',
     'create_connection',
     'execute_query',
     'execute_many',
@@ -6,6 +6,7 @@ and query execution.
 """
 
 import os
+import re
 from contextlib import contextmanager
 import sqlite3
 import logging
@@ -40,12 +41,22 @@ def create_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
         db_path = DB_PATH
 
     try:
-        # Ensure the data directory exists
-        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        # Ensure the data directory exists; ":memory:" and bare file names have none
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+
+        # Keep more prepared statements around; the scrapers reuse a handful of upserts heavily
+        conn = sqlite3.connect(db_path, cached_statements=512)
 
         # Enable foreign key constraints
-        conn = sqlite3.connect(db_path)
         conn.execute("PRAGMA foreign_keys = ON")
+
+        # WAL with NORMAL sync only fsyncs at checkpoints, which keeps bulk scraper writes fast
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")  # 64 MB
         return conn
     except sqlite3.Error as e:
         logger.error(f"Database connection error: {e}")
@@ -306,6 +317,109 @@ def create_indexes(conn: sqlite3.Connection, indexes: List[str]) -> None:
     conn.commit()
 
 
+def _table_definition(conn: sqlite3.Connection, table_name: str) -> Tuple[List[Tuple], bool]:
+    """Get a table's columns (name, type, notnull, default, pk, hidden) and whether it is WITHOUT ROWID."""
+    cursor = conn.cursor()
+    cursor.execute(f"PRAGMA table_xinfo({table_name})")
+    columns = [tuple(row[1:]) for row in cursor.fetchall()]
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,))
+    row = cursor.fetchone()
+    without_rowid = bool(row and "WITHOUT ROWID" in row[0].upper())
+    return columns, without_rowid
+
+
+def migrate_table(conn: sqlite3.Connection, table_name: str, schema: str) -> bool:
+    """
+    Rebuild an existing table whose definition no longer matches its schema.
+
+    Tables are created with IF NOT EXISTS, so a changed definition (such as a
+    new primary key) never reaches a database built before the change. The
+    table is rebuilt from the schema and its rows copied over, keeping the
+    columns both definitions share; generated columns are recomputed and rows
+    with a NULL primary key column, or a duplicate primary key, are dropped.
+    The table's indexes go with the old table and are recreated by create_indexes.
+
+    Args:
+        conn: Database connection
+        table_name: Name of the table to migrate
+        schema: SQL schema definition for the table
+
+    Returns:
+        True if the table was rebuilt, False if it is missing or up to date
+
+    Raises:
+        sqlite3.Error: If the rebuild fails; the table is then left unchanged
+    """
+    current = _table_definition(conn, table_name)
+    if not current[0]:
+        return False
+
+    new_name = f"{table_name}_new"
+    new_schema = re.sub(rf"\b{table_name}\b", new_name, schema, count=1)
+
+    # Foreign key enforcement can only change outside a transaction
+    foreign_keys = conn.execute("PRAGMA foreign_keys").fetchone()[0]
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN")
+        cursor.execute(f"DROP TABLE IF EXISTS {new_name}")
+        cursor.execute(new_schema)
+
+        expected = _table_definition(conn, new_name)
+        if expected == current:
+            conn.rollback()
+            return False
+
+        logger.warning(f"Table {table_name} does not match the current schema, rebuilding it")
+        old_columns = {column[0] for column in current[0]}
+        # hidden is 2 or 3 for generated columns, which cannot be inserted into
+        columns = ", ".join(column[0] for column in expected[0]
+                            if column[5] == 0 and column[0] in old_columns)
+        key_filter = " AND ".join(f"{column[0]} IS NOT NULL" for column in expected[0] if column[4])
+        query = f"INSERT OR REPLACE INTO {new_name} ({columns}) SELECT {columns} FROM {table_name}"
+        if key_filter:
+            query += f" WHERE {key_filter}"
+        cursor.execute(query)
+        logger.info(f"Copied {cursor.rowcount} rows into the rebuilt {table_name} table")
+
+        cursor.execute(f"DROP TABLE {table_name}")
+        cursor.execute(f"ALTER TABLE {new_name} RENAME TO {table_name}")
+        conn.commit()
+        return True
+    except sqlite3.Error as e:
+        logger.error(f"Migration error for {table_name}: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """
+    Create all tables and indexes defined in the schema on a connection.
+
+    Existing tables whose definition has changed are rebuilt first with
+    migrate_table, keeping their data.
+
+    Args:
+        conn: Database connection
+
+    Raises:
+        sqlite3.Error: If table creation or migration fails
+    """
+    # Create tables, migrating any built from an older schema
+    for table_name, table_info in DB_SCHEMA["tables"].items():
+        migrate_table(conn, table_name, table_info["schema"])
+        create_table(conn, table_name, table_info["schema"])
+        logger.info(f"Created table: {table_name}")
+
+    # Create indexes
+    for index_group, index_list in DB_SCHEMA["indexes"].items():
+        logger.info(f"Creating indexes for {index_group}")
+        create_indexes(conn, index_list)
+
+
 def setup_database(db_path: Optional[str] = None) -> None:
     """
     Set up the database schema.
@@ -324,21 +438,14 @@ def setup_database(db_path: Optional[str] = None) -> None:
     logger.info(f"Setting up database at {db_path}")
 
     # Create data directory if it doesn't exist
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    db_dir = os.path.dirname(db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
 
     # Connect to database
     conn = create_connection(db_path)
     try:
-        # Create tables
-        for table_name, table_info in DB_SCHEMA["tables"].items():
-            create_table(conn, table_name, table_info["schema"])
-            logger.info(f"Created table: {table_name}")
-
-        # Create indexes
-        for index_group, index_list in DB_SCHEMA["indexes"].items():
-            logger.info(f"Creating indexes for {index_group}")
-            create_indexes(conn, index_list)
-
+        create_schema(conn)
         logger.info("Database setup complete")
     except sqlite3.Error as e:
         logger.error(f"Database setup failed: {e}")
@@ -369,10 +476,11 @@ def reset_database(db_path: Optional[str] = None, confirm: bool = False) -> None
 
     logger.warning(f"Resetting database at {db_path}")
 
-    # If the database file exists, delete it
-    if os.path.exists(db_path):
-        os.remove(db_path)
-        logger.info(f"Deleted existing database file: {db_path}")
+    # If the database file exists, delete it along with any WAL files
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+            logger.info(f"Deleted existing database file: {path}")
 
     # Set up a new database
     setup_database(db_path)
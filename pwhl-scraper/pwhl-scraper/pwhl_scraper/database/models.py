@@ -205,7 +205,6 @@ DB_SCHEMA = {
         "season_stats_teams": {
             "schema": """
                 CREATE TABLE IF NOT EXISTS season_stats_teams (
-                    id TEXT PRIMARY KEY,
                     season_id INTEGER,
                     team_id INTEGER,
                     division_id INTEGER,
@@ -250,6 +249,7 @@ DB_SCHEMA = {
                     shootout_record TEXT,
                     home_record TEXT,
                     visiting_record TEXT,
+                    PRIMARY KEY (season_id, team_id),
                     FOREIGN KEY (season_id) REFERENCES seasons(id),
                     FOREIGN KEY (team_id) REFERENCES teams(id)
                 );
@@ -260,7 +260,6 @@ DB_SCHEMA = {
         "season_stats_skaters": {
             "schema": """
                 CREATE TABLE IF NOT EXISTS season_stats_skaters (
-                    id TEXT PRIMARY KEY,
                     player_id INTEGER,
                     season_id INTEGER,
                     team_id INTEGER,
@@ -275,7 +274,9 @@ DB_SCHEMA = {
                     empty_net_goals INTEGER,
                     overtime_goals INTEGER,
                     ice_time INTEGER,
-                    ice_time_avg REAL,
+                    ice_time_avg REAL GENERATED ALWAYS AS (
+                        CASE WHEN games_played > 0 THEN CAST(ice_time AS REAL) / games_played ELSE 0.0 END
+                    ) STORED,
                     goals INTEGER,
                     shots INTEGER,
                     hits INTEGER,
@@ -306,6 +307,7 @@ DB_SCHEMA = {
                     faceoff_wa TEXT,
                     shots_on INTEGER,
                     shootout_percentage REAL,
+                    PRIMARY KEY (player_id, season_id),
                     FOREIGN KEY (player_id) REFERENCES players(id),
                     FOREIGN KEY (season_id) REFERENCES seasons(id),
                     FOREIGN KEY (team_id) REFERENCES teams(id)
@@ -317,7 +319,6 @@ DB_SCHEMA = {
         "season_stats_goalies": {
             "schema": """
             CREATE TABLE IF NOT EXISTS season_stats_goalies (
-                id TEXT PRIMARY KEY,
                 player_id INTEGER,
                 season_id INTEGER,
                 team_id INTEGER,
@@ -359,6 +360,8 @@ DB_SCHEMA = {
                 ties INTEGER,
                 shots_against_average REAL,
                 goals_against_average REAL,
+                row_hash INTEGER,
+                PRIMARY KEY (player_id, season_id),
                 FOREIGN KEY (player_id) REFERENCES players(id),
                 FOREIGN KEY (season_id) REFERENCES seasons(id),
                 FOREIGN KEY (team_id) REFERENCES teams(id)
@@ -370,7 +373,6 @@ DB_SCHEMA = {
         "game_stats_teams": {
             "schema": """
                 CREATE TABLE IF NOT EXISTS game_stats_teams (
-                    id TEXT PRIMARY KEY,
                     game_id INTEGER,
                     team_id INTEGER,
                     season_id INTEGER,
@@ -380,6 +382,7 @@ DB_SCHEMA = {
                     power_play_goals INTEGER,
                     fow INTEGER, -- faceoff wins
                     hits INTEGER,
+                    PRIMARY KEY (game_id, team_id),
                     FOREIGN KEY (game_id) REFERENCES games(id),
                     FOREIGN KEY (team_id) REFERENCES teams(id),
                     FOREIGN KEY (season_id) REFERENCES seasons(id)
@@ -391,7 +394,6 @@ DB_SCHEMA = {
         "game_stats_skaters": {
             "schema": """
                 CREATE TABLE IF NOT EXISTS game_stats_skaters (
-                    id TEXT PRIMARY KEY,
                     game_id INTEGER,
                     player_id INTEGER,
                     team_id INTEGER,
@@ -415,6 +417,7 @@ DB_SCHEMA = {
                     power_play_goals INTEGER,
                     short_handed_goals INTEGER,
                     game_winning_goal BOOLEAN,
+                    PRIMARY KEY (game_id, player_id),
                     FOREIGN KEY (game_id) REFERENCES games(id),
                     FOREIGN KEY (player_id) REFERENCES players(id),
                     FOREIGN KEY (team_id) REFERENCES teams(id),
@@ -427,7 +430,6 @@ DB_SCHEMA = {
         "game_stats_goalies": {
             "schema": """
                 CREATE TABLE IF NOT EXISTS game_stats_goalies (
-                    id TEXT PRIMARY KEY,
                     game_id INTEGER,
                     player_id INTEGER,
                     team_id INTEGER,
@@ -446,11 +448,12 @@ DB_SCHEMA = {
                     assists INTEGER,
                     pim INTEGER,
                     shots INTEGER,
+                    PRIMARY KEY (game_id, player_id),
                     FOREIGN KEY (game_id) REFERENCES games(id),
                     FOREIGN KEY (player_id) REFERENCES players(id),
                     FOREIGN KEY (team_id) REFERENCES teams(id),
                     FOREIGN KEY (season_id) REFERENCES seasons(id)
-                );
+                ) WITHOUT ROWID;
                 """
         },
 
@@ -777,22 +780,17 @@ DB_SCHEMA = {
             "CREATE INDEX IF NOT EXISTS idx_season_stats_teams_season ON season_stats_teams(season_id);",
             "CREATE INDEX IF NOT EXISTS idx_season_stats_teams_team ON season_stats_teams(team_id);",
             "CREATE INDEX IF NOT EXISTS idx_season_stats_skaters_season ON season_stats_skaters(season_id);",
-            "CREATE INDEX IF NOT EXISTS idx_season_stats_skaters_player ON season_stats_skaters(player_id);",
             "CREATE INDEX IF NOT EXISTS idx_season_stats_skaters_team ON season_stats_skaters(team_id);",
             "CREATE INDEX IF NOT EXISTS idx_season_stats_goalies_season ON season_stats_goalies(season_id);",
-            "CREATE INDEX IF NOT EXISTS idx_season_stats_goalies_player ON season_stats_goalies(player_id);",
             "CREATE INDEX IF NOT EXISTS idx_season_stats_goalies_team ON season_stats_goalies(team_id);"
         ],
 
         "game_stats": [
-            "CREATE INDEX IF NOT EXISTS idx_game_stats_teams_game ON game_stats_teams(game_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_teams_team ON game_stats_teams(team_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_teams_season ON game_stats_teams(season_id);",
-            "CREATE INDEX IF NOT EXISTS idx_game_stats_skaters_game ON game_stats_skaters(game_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_skaters_player ON game_stats_skaters(player_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_skaters_team ON game_stats_skaters(team_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_skaters_season ON game_stats_skaters(season_id);",
-            "CREATE INDEX IF NOT EXISTS idx_game_stats_goalies_game ON game_stats_goalies(game_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_goalies_player ON game_stats_goalies(player_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_goalies_team ON game_stats_goalies(team_id);",
             "CREATE INDEX IF NOT EXISTS idx_game_stats_goalies_season ON game_stats_goalies(season_id);"
@@ -3,18 +3,323 @@ Statistics data scraper for PWHL Scraper.
 
 This module fetches and updates statistics for teams, players, and games.
 """
+import hashlib
 import logging
 import sqlite3
-import time
-from typing import Dict, Any, Optional, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, List, Tuple, Union
 
 from pwhl_scraper.api.client import PWHLApiClient
-from pwhl_scraper.database.db_manager import create_connection, fetch_all
+from pwhl_scraper.database.db_manager import create_connection
+from pwhl_scraper.utils.converters import coerce_row
 
 logger = logging.getLogger(__name__)
 
+# (key, cast, default) specs for the fields parsed from the API, in column order
+_SEASON_TEAM_FIELDS = (
+    ("division_id", int, None),
+    ("wins", int, 0), ("losses", int, 0), ("ties", int, 0), ("ot_losses", int, 0),
+    ("reg_ot_losses", int, 0), ("reg_losses", int, 0), ("ot_wins", int, 0),
+    ("shootout_wins", int, 0), ("shootout_losses", int, 0), ("regulation_wins", int, 0),
+    ("row", int, 0), ("points", int, 0),
+    ("bench_minutes", int, 0), ("penalty_minutes", int, 0),
+    ("goals_for", int, 0), ("goals_against", int, 0), ("goals_diff", int, 0),
+    ("power_play_goals", int, 0), ("power_play_goals_against", int, 0),
+    ("shootout_goals", int, 0), ("shootout_goals_against", int, 0),
+    ("shootout_attempts", int, 0), ("shootout_attempts_against", int, 0),
+    ("short_handed_goals_for", int, 0), ("short_handed_goals_against", int, 0),
+    ("percentage", float, 0.0), ("percentage_full", float, 0.0),
+    ("shootout_games_played", int, 0), ("games_played", int, 0),
+    ("shootout_pct", float, 0.0), ("power_play_pct", float, 0.0),
+    ("shootout_pct_goals_for", float, 0.0), ("shootout_pct_goals_against", float, 0.0),
+    ("penalty_kill_pct", float, 0.0), ("pim_pg", float, 0.0),
+    ("power_plays", int, 0), ("win_percentage", float, 0.0), ("times_short_handed", int, 0),
+    ("shootout_record", str, ""), ("home_record", str, ""), ("visiting_record", str, ""),
+)
+
+# ice_time_avg is not parsed; it is a generated column computed by SQLite
+_SEASON_SKATER_FIELDS = (
+    ("games_played", int, 0), ("ice_time", int, 0),
+    ("team_id", int, None), ("jersey_number", int, None), ("shoots", str, ""),
+    ("game_winning_goals", int, 0), ("game_tieing_goals", int, 0), ("first_goals", int, 0),
+    ("insurance_goals", int, 0), ("unassisted_goals", int, 0), ("empty_net_goals", int, 0),
+    ("overtime_goals", int, 0), ("ice_time_minutes_seconds", str, ""),
+    ("goals", int, 0), ("assists", int, 0), ("points", int, 0),
+    ("points_per_game", float, 0.0), ("plus_minus", int, 0), ("shots", int, 0),
+    ("shooting_percentage", float, 0.0),
+    ("hits", int, 0), ("shots_blocked_by_player", int, 0),
+    ("penalty_minutes", int, 0), ("penalty_minutes_per_game", float, 0.0),
+    ("minor_penalties", int, 0), ("major_penalties", int, 0),
+    ("power_play_goals", int, 0), ("power_play_assists", int, 0), ("power_play_points", int, 0),
+    ("short_handed_goals", int, 0), ("short_handed_assists", int, 0), ("short_handed_points", int, 0),
+    ("shootout_goals", int, 0), ("shootout_attempts", int, 0), ("shootout_winning_goals", int, 0),
+    ("shootout_games_played", int, 0), ("shootout_percentage", float, 0.0),
+    ("faceoff_attempts", int, 0), ("faceoff_wins", int, 0), ("faceoff_pct", float, 0.0),
+    ("faceoff_wa", str, ""), ("shots_on", int, 0),
+)
+
+_SEASON_GOALIE_FIELDS = (
+    ("team_id", int, None), ("jersey_number", int, None), ("shoots", str, ""), ("catches", str, ""),
+    ("games_played", int, 0), ("ice_time", int, 0), ("minutes_played", str, ""),
+    ("saves", int, 0), ("shots", int, 0), ("save_percentage", float, 0.0),
+    ("goals_against", int, 0), ("empty_net_goals_against", int, 0), ("shutouts", int, 0),
+    ("wins", int, 0), ("losses", int, 0), ("ot_losses", int, 0), ("ot", int, 0), ("ties", int, 0),
+    ("shootout_games_played", int, 0), ("shootout_losses", int, 0), ("shootout_wins", int, 0),
+    ("shootout_goals_against", int, 0), ("shootout_saves", int, 0), ("shootout_attempts", int, 0),
+    ("shootout_percentage", float, 0.0),
+    ("goals", int, 0), ("assists", int, 0), ("points", int, 0), ("penalty_minutes", int, 0),
+    ("goals_against_average", float, 0.0),
+)
+
+
+def _field_names(spec: Tuple[Tuple[str, Any, Any], ...]) -> Tuple[str, ...]:
+    """Get the column names of a (key, cast, default) field spec."""
+    return tuple(key for key, _, _ in spec)
+
+
+# Column order of the rows written to each season stats table; the parsed
+# columns come straight from the field specs so the SQL cannot drift from them
+_SEASON_TEAMS_COLS = ("season_id", "team_id") + _field_names(_SEASON_TEAM_FIELDS)
+
+_SEASON_SKATERS_COLS = ("player_id", "season_id") + _field_names(_SEASON_SKATER_FIELDS)
+
+# Goalie columns derived from the parsed fields rather than read from the API
+_SEASON_GOALIE_DERIVED_COLS = (
+    "ice_time_avg", "has_games_played", "minutes_played_g", "seconds_played",
+    "total_losses", "shots_against_average",
+)
+
+_SEASON_GOALIES_COLS = (
+    ("player_id", "season_id")
+    + _field_names(_SEASON_GOALIE_FIELDS)
+    + _SEASON_GOALIE_DERIVED_COLS
+)
+
+# Positions of the parsed goalie fields the derived columns are computed from
+_GOALIE_GP, _GOALIE_ICE, _GOALIE_SHOTS, _GOALIE_LOSSES, _GOALIE_OTL = (
+    _field_names(_SEASON_GOALIE_FIELDS).index(key)
+    for key in ("games_played", "ice_time", "shots", "losses", "ot_losses")
+)
+
+
+def _build_upsert_sql(table: str, columns: Tuple[str, ...], key: Tuple[str, ...]) -> str:
+    """Build an INSERT ... ON CONFLICT(key) DO UPDATE statement (SQLite 3.24+) for the given columns."""
+    placeholders = ", ".join("?" * len(columns))
+    updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col not in key)
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT({', '.join(key)}) DO UPDATE SET {updates}")
+
+
+_UPSERT_SEASON_TEAMS_SQL = _build_upsert_sql(
+    "season_stats_teams", _SEASON_TEAMS_COLS, ("season_id", "team_id"))
+_UPSERT_SEASON_SKATERS_SQL = _build_upsert_sql(
+    "season_stats_skaters", _SEASON_SKATERS_COLS, ("player_id", "season_id"))
+_UPSERT_SEASON_GOALIES_SQL = _build_upsert_sql(
+    "season_stats_goalies", _SEASON_GOALIES_COLS + ("row_hash",), ("player_id", "season_id"))
+
+_SELECT_SEASON_GOALIE_HASHES_SQL = "SELECT season_id, row_hash FROM season_stats_goalies WHERE player_id = ?"
+
+_GAME_TEAMS_COLS = (
+    "game_id", "team_id", "season_id", "goals", "shots_on_goal",
+    "power_play_total", "power_play_goals", "fow", "hits",
+)
+
+_UPSERT_GAME_TEAMS_SQL = _build_upsert_sql("game_stats_teams", _GAME_TEAMS_COLS, ("game_id", "team_id"))
+
+_GAME_SKATERS_COLS = (
+    "game_id", "player_id", "team_id", "season_id", "jersey_number",
+    "position", "rookie", "start", "status", "goals", "assists", "plusminus",
+    "pim", "faceoff_wins", "faceoff_attempts", "hits", "shots", "shots_on",
+    "shots_blocked_by_player", "shots_blocked", "power_play_goals",
+    "short_handed_goals", "game_winning_goal",
+)
+
+_UPSERT_GAME_SKATERS_SQL = _build_upsert_sql("game_stats_skaters", _GAME_SKATERS_COLS, ("game_id", "player_id"))
+
+# Integer stat fields parsed for each skater in a game lineup, in column order
+_GAME_SKATER_INT_KEYS = (
+    "goals", "assists", "plusminus", "pim", "faceoff_wins", "faceoff_attempts", "hits", "shots",
+    "shots_on", "shots_blocked_by_player", "shots_blocked", "power_play_goals", "short_handed_goals"
+)
+
+# Integer stat fields parsed for each goalie in a game lineup
+_GAME_GOALIE_INT_KEYS = (
+    "seconds", "shots_against", "goals_against", "saves", "goals", "assists", "pim", "shots"
+)
+
+# (meta key, label) of the season, home team and visitor team IDs of a game
+_GAME_ID_KEYS = (
+    ("season_id", "season ID"), ("home_team", "home team ID"), ("visiting_team", "visitor team ID")
+)
+
+# Meta keys holding each side's team ID and goal count
+_GAME_TEAM_META_KEYS = {
+    "home": ("home_team", "home_goal_count"),
+    "visitor": ("visiting_team", "visiting_goal_count"),
+}
 
-def get_seasons(conn: sqlite3.Connection) -> List[Tuple[int]]:
+# Ice time values of a goalie who did not play
+_NO_ICE_TIME = (0, "0", None)
+
+_GAME_GOALIES_COLS = (
+    "game_id", "player_id", "team_id", "season_id", "jersey_number",
+    "position", "rookie", "start", "status", "seconds", "time",
+    "shots_against", "goals_against", "saves", "goals", "assists", "pim", "shots"
+)
+
+_UPSERT_GAME_GOALIES_SQL = _build_upsert_sql("game_stats_goalies", _GAME_GOALIES_COLS, ("game_id", "player_id"))
+
+# Games written per commit when updating every game
+_GAME_COMMIT_INTERVAL = 50
+
+_SELECT_PLAYER_POSITION_SQL = "SELECT position FROM players WHERE id = ?"
+
+_SELECT_SKATER_IDS_SQL = "SELECT id FROM players WHERE UPPER(position) != 'G' ORDER BY id ASC"
+
+_SELECT_GOALIE_IDS_SQL = "SELECT id FROM players WHERE position = 'G' ORDER BY id ASC"
+
+# Number of rows sent to the database per executemany call
+_BATCH_SIZE = 1000
+
+
+def _chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most size items."""
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _row_hash(row: Tuple[Any, ...]) -> int:
+    """Get a fingerprint of a row that is stable across processes and fits an SQLite INTEGER."""
+    digest = hashlib.blake2b(repr(row).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+def _changed_rows(rows: Iterable[Tuple[Any, ...]], stored_hashes: Dict[Any, int],
+                  key_index: int) -> Iterator[Tuple[Any, ...]]:
+    """
+    Filter out rows whose fingerprint matches the one already stored.
+
+    Args:
+        rows: Iterable of rows
+        stored_hashes: Stored row_hash values keyed by row[key_index]
+        key_index: Position of the column identifying the stored row
+
+    Yields:
+        Changed or new rows, with their row_hash appended
+    """
+    for row in rows:
+        row_hash = _row_hash(row)
+        if stored_hashes.get(row[key_index]) != row_hash:
+            yield row + (row_hash,)
+
+
+def _begin_immediate(cursor: sqlite3.Cursor) -> None:
+    """Open a write transaction up front unless one is already in progress."""
+    if not cursor.connection.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
+
+
+def _in_savepoint(conn: sqlite3.Connection, write: Callable[[], int]) -> int:
+    """
+    Run a write inside a savepoint of the connection's write transaction.
+
+    A failure rolls back only this write, not the other uncommitted writes
+    before it, so a driver can commit many writes at once.
+
+    Args:
+        conn: Database connection
+        write: Function performing the write and returning its record count
+
+    Returns:
+        The write's record count, or 0 if it failed
+    """
+    cursor = conn.cursor()
+    _begin_immediate(cursor)
+    cursor.execute("SAVEPOINT write")
+    try:
+        updated_count = write()
+    except Exception as e:
+        # Database errors are logged by the write itself
+        if not isinstance(e, sqlite3.Error):
+            logger.error(f"Unexpected error writing stats, rolling it back: {e}")
+        cursor.execute("ROLLBACK TO write")
+        updated_count = 0
+    cursor.execute("RELEASE write")
+    return updated_count
+
+
+def _executemany_chunked(cursor: sqlite3.Cursor, sql: str, rows: Iterable[Tuple[Any, ...]],
+                         size: int = _BATCH_SIZE) -> int:
+    """
+    Execute a statement for a stream of rows, size rows at a time.
+
+    Args:
+        cursor: Database cursor
+        sql: Statement to execute for each row
+        rows: Iterable of parameter tuples
+        size: Maximum number of rows per executemany call
+
+    Returns:
+        Number of rows executed
+    """
+    count = 0
+    for chunk in _chunks(rows, size):
+        cursor.executemany(sql, chunk)
+        count += len(chunk)
+    return count
+
+
+def _ids(conn: sqlite3.Connection, table: str, descending: bool = False) -> List[int]:
+    """
+    Get all IDs from a table as a flat list.
+
+    Args:
+        conn: Database connection
+        table: Table to read IDs from
+        descending: Whether to sort the IDs in descending order
+
+    Returns:
+        List of IDs
+    """
+    order = "DESC" if descending else "ASC"
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(f"SELECT id FROM {table} ORDER BY id {order}")
+    return [row[0] for row in cursor]
+
+
+def _safe_int(data: Dict[str, Any], key: str, default: Optional[int] = 0) -> Optional[int]:
+    """Get a field from a dictionary as an int, or the default if it is missing or invalid."""
+    value = data.get(key)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_ints(data: Dict[str, Any], keys: Tuple[str, ...]) -> Tuple[int, ...]:
+    """
+    Get several fields from a dictionary as ints, like _safe_int with a default of 0.
+
+    Well-formed rows are converted in one pass; only a row with a bad value
+    falls back to converting field by field.
+    """
+    get = data.get
+    try:
+        return tuple([int(get(key) or 0) for key in keys])
+    except (ValueError, TypeError):
+        return tuple([_safe_int(data, key) for key in keys])
+
+
+def get_seasons(conn: sqlite3.Connection) -> List[int]:
     """
     Get all season IDs from the database.
 
@@ -25,16 +330,13 @@ def get_seasons(conn: sqlite3.Connection) -> List[Tuple[int]]:
         List of season IDs
     """
     try:
-        # Get seasons
-        seasons_query = "SELECT id FROM seasons ORDER BY id DESC"
-        seasons = fetch_all(conn, seasons_query)
-        return seasons
+        return _ids(conn, "seasons", descending=True)
     except sqlite3.Error as e:
         logger.error(f"Error getting seasons: {e}")
         return []
 
 
-def get_teams(conn: sqlite3.Connection) -> List[Tuple[int]]:
+def get_teams(conn: sqlite3.Connection) -> List[int]:
     """
     Get all team IDs from the database.
 
@@ -45,16 +347,13 @@ def get_teams(conn: sqlite3.Connection) -> List[Tuple[int]]:
         List of team IDs
     """
     try:
-        # Get teams
-        teams_query = "SELECT id FROM teams ORDER BY id"
-        teams = fetch_all(conn, teams_query)
-        return teams
+        return _ids(conn, "teams")
     except sqlite3.Error as e:
         logger.error(f"Error getting teams: {e}")
         return []
 
 
-def get_players(conn: sqlite3.Connection) -> List[Tuple[int]]:
+def get_players(conn: sqlite3.Connection) -> List[int]:
     """
     Get all player IDs from the database.
 
@@ -65,16 +364,55 @@ def get_players(conn: sqlite3.Connection) -> List[Tuple[int]]:
         List of player IDs
     """
     try:
-        # Get players
-        players_query = "SELECT id FROM players ORDER BY id"
-        players = fetch_all(conn, players_query)
-        return players
+        return _ids(conn, "players")
     except sqlite3.Error as e:
         logger.error(f"Error getting players: {e}")
         return []
 
 
-def get_games(conn: sqlite3.Connection) -> List[Tuple[int]]:
+def _player_ids(conn: sqlite3.Connection, sql: str) -> List[int]:
+    """Run a player ID query and return the IDs as a flat list."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql)
+    return [row[0] for row in cursor]
+
+
+def get_skater_ids(conn: sqlite3.Connection) -> List[int]:
+    """
+    Get the IDs of all players who are not goalies.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        List of skater player IDs
+    """
+    try:
+        return _player_ids(conn, _SELECT_SKATER_IDS_SQL)
+    except sqlite3.Error as e:
+        logger.error(f"Error getting skaters: {e}")
+        return []
+
+
+def get_goalie_ids(conn: sqlite3.Connection) -> List[int]:
+    """
+    Get the IDs of all goalies.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        List of goalie player IDs
+    """
+    try:
+        return _player_ids(conn, _SELECT_GOALIE_IDS_SQL)
+    except sqlite3.Error as e:
+        logger.error(f"Error getting goalies: {e}")
+        return []
+
+
+def get_games(conn: sqlite3.Connection) -> List[int]:
     """
     Get all game IDs from the database.
 
@@ -85,10 +423,7 @@ def get_games(conn: sqlite3.Connection) -> List[Tuple[int]]:
         List of game IDs
     """
     try:
-        # Get games
-        games_query = "SELECT id FROM games ORDER BY id"
-        games = fetch_all(conn, games_query)
-        return games
+        return _ids(conn, "games")
     except sqlite3.Error as e:
         logger.error(f"Error getting games: {e}")
         return []
@@ -132,215 +467,61 @@ def fetch_team_season_stats(client: PWHLApiClient, season_id: int) -> List[Dict[
     return team_stats
 
 
-def update_season_stats_teams(conn: sqlite3.Connection, season_id: int, teams_stats: List[Dict[str, Any]]) -> int:
+def _season_team_rows(season_id: int, teams_stats: List[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
     """
-    Update team season statistics in the database.
+    Build team season stats rows for one season.
 
     Args:
-        conn: Database connection
         season_id: Season ID
         teams_stats: List of team stats dictionaries
 
-    Returns:
-        Number of teams updated
+    Yields:
+        Rows in season_stats_teams column order; entries that fail to parse are logged and skipped
     """
-    logger.info(f"Updating team season stats for season {season_id}")
-
-    updated_count = 0
-
     for team_stats in teams_stats:
         try:
             team_id = int(team_stats.get('team_id', 0))
             if not team_id:
                 continue
 
-            # Create a unique ID for this season-team stats record
-            stats_id = f"{season_id}_{team_id}"
-
-            # Extract division info
-            try:
-                division_id = int(team_stats.get('division_id', 0))
-            except (ValueError, TypeError):
-                division_id = None
+            yield (season_id, team_id) + coerce_row(team_stats, _SEASON_TEAM_FIELDS)
 
-            # Extract wins/losses/points info
-            try:
-                wins = int(team_stats.get('wins', 0))
-                losses = int(team_stats.get('losses', 0))
-                ties = int(team_stats.get('ties', 0))
-                ot_losses = int(team_stats.get('ot_losses', 0))
-                reg_ot_losses = int(team_stats.get('reg_ot_losses', 0))
-                reg_losses = int(team_stats.get('reg_losses', 0))
-                ot_wins = int(team_stats.get('ot_wins', 0))
-                shootout_wins = int(team_stats.get('shootout_wins', 0))
-                shootout_losses = int(team_stats.get('shootout_losses', 0))
-                regulation_wins = int(team_stats.get('regulation_wins', 0))
-                row = int(team_stats.get('row', 0))  # Regulation + Overtime Wins
-                points = int(team_stats.get('points', 0))
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Error parsing win/loss data for team {team_id}: {e}")
-                wins = losses = ties = ot_losses = reg_ot_losses = reg_losses = 0
-                ot_wins = shootout_wins = shootout_losses = regulation_wins = row = points = 0
-
-            # Extract penalty info
-            try:
-                bench_minutes = int(team_stats.get('bench_minutes', 0))
-                penalty_minutes = int(team_stats.get('penalty_minutes', 0))
-            except (ValueError, TypeError):
-                bench_minutes = penalty_minutes = 0
-
-            # Extract goals info
-            try:
-                goals_for = int(team_stats.get('goals_for', 0))
-                goals_against = int(team_stats.get('goals_against', 0))
-                goals_diff = int(team_stats.get('goals_diff', 0))
-            except (ValueError, TypeError):
-                goals_for = goals_against = goals_diff = 0
-
-            # Extract special teams info
-            try:
-                power_play_goals = int(team_stats.get('power_play_goals', 0))
-                power_play_goals_against = int(team_stats.get('power_play_goals_against', 0))
-                shootout_goals = int(team_stats.get('shootout_goals', 0))
-                shootout_goals_against = int(team_stats.get('shootout_goals_against', 0))
-                shootout_attempts = int(team_stats.get('shootout_attempts', 0))
-                shootout_attempts_against = int(team_stats.get('shootout_attempts_against', 0))
-                short_handed_goals_for = int(team_stats.get('short_handed_goals_for', 0))
-                short_handed_goals_against = int(team_stats.get('short_handed_goals_against', 0))
-            except (ValueError, TypeError):
-                power_play_goals = power_play_goals_against = 0
-                shootout_goals = shootout_goals_against = 0
-                shootout_attempts = shootout_attempts_against = 0
-                short_handed_goals_for = short_handed_goals_against = 0
-
-            # Extract percentages
-            try:
-                percentage = float(team_stats.get('percentage', 0))
-                percentage_full = float(team_stats.get('percentage_full', 0))
-            except (ValueError, TypeError):
-                percentage = percentage_full = 0.0
-
-            # Extract games info
-            try:
-                shootout_games_played = int(team_stats.get('shootout_games_played', 0))
-                games_played = int(team_stats.get('games_played', 0))
-            except (ValueError, TypeError):
-                shootout_games_played = games_played = 0
-
-            # Extract more percentages and rates
-            try:
-                shootout_pct = float(team_stats.get('shootout_pct', 0))
-                power_play_pct = float(team_stats.get('power_play_pct', 0))
-                shootout_pct_goals_for = float(team_stats.get('shootout_pct_goals_for', 0))
-                shootout_pct_goals_against = float(team_stats.get('shootout_pct_goals_against', 0))
-                penalty_kill_pct = float(team_stats.get('penalty_kill_pct', 0))
-                pim_pg = float(team_stats.get('pim_pg', 0))
-            except (ValueError, TypeError):
-                shootout_pct = power_play_pct = shootout_pct_goals_for = 0.0
-                shootout_pct_goals_against = penalty_kill_pct = pim_pg = 0.0
-
-            # Extract miscellaneous
-            try:
-                power_plays = int(team_stats.get('power_plays', 0))
-                win_percentage = float(team_stats.get('win_percentage', 0))
-                times_short_handed = int(team_stats.get('times_short_handed', 0))
-            except (ValueError, TypeError):
-                power_plays = 0
-                win_percentage = 0.0
-                times_short_handed = 0
-
-            # Extract records
-            shootout_record = team_stats.get('shootout_record', '')
-            home_record = team_stats.get('home_record', '')
-            visiting_record = team_stats.get('visiting_record', '')
+        except Exception as e:
+            logger.error(f"Error processing team stats: {e}")
+            continue
 
-            # Check if stats record exists in database
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM season_stats_teams WHERE id = ?", (stats_id,))
-            exists = cursor.fetchone()
 
-            try:
-                if exists:
-                    # Update existing stats
-                    query = """
-                    UPDATE season_stats_teams 
-                    SET division_id = ?,
-                        wins = ?, losses = ?, ties = ?, ot_losses = ?, reg_ot_losses = ?,
-                        reg_losses = ?, ot_wins = ?, shootout_wins = ?, shootout_losses = ?,
-                        regulation_wins = ?, row = ?, points = ?, bench_minutes = ?,
-                        penalty_minutes = ?, goals_for = ?, goals_against = ?, goals_diff = ?,
-                        power_play_goals = ?, power_play_goals_against = ?, shootout_goals = ?,
-                        shootout_goals_against = ?, shootout_attempts = ?, shootout_attempts_against = ?,
-                        short_handed_goals_for = ?, short_handed_goals_against = ?, percentage = ?,
-                        percentage_full = ?, shootout_games_played = ?, games_played = ?,
-                        shootout_pct = ?, power_play_pct = ?, shootout_pct_goals_for = ?,
-                        shootout_pct_goals_against = ?, penalty_kill_pct = ?, pim_pg = ?,
-                        power_plays = ?, win_percentage = ?, times_short_handed = ?,
-                        shootout_record = ?, home_record = ?, visiting_record = ?
-                    WHERE id = ?
-                    """
-                    cursor.execute(query, (
-                        division_id,
-                        wins, losses, ties, ot_losses, reg_ot_losses,
-                        reg_losses, ot_wins, shootout_wins, shootout_losses,
-                        regulation_wins, row, points, bench_minutes,
-                        penalty_minutes, goals_for, goals_against, goals_diff,
-                        power_play_goals, power_play_goals_against, shootout_goals,
-                        shootout_goals_against, shootout_attempts, shootout_attempts_against,
-                        short_handed_goals_for, short_handed_goals_against, percentage,
-                        percentage_full, shootout_games_played, games_played,
-                        shootout_pct, power_play_pct, shootout_pct_goals_for,
-                        shootout_pct_goals_against, penalty_kill_pct, pim_pg,
-                        power_plays, win_percentage, times_short_handed,
-                        shootout_record, home_record, visiting_record,
-                        stats_id
-                    ))
-                    logger.info(f"Updated team season stats for team {team_id}, season {season_id}")
-                else:
-                    # Insert new stats
-                    query = """
-                    INSERT INTO season_stats_teams (
-                        id, season_id, team_id, division_id,
-                        wins, losses, ties, ot_losses, reg_ot_losses, reg_losses, ot_wins,
-                        shootout_wins, shootout_losses, regulation_wins, row, points,
-                        bench_minutes, penalty_minutes, goals_for, goals_against, goals_diff,
-                        power_play_goals, power_play_goals_against, shootout_goals,
-                        shootout_goals_against, shootout_attempts, shootout_attempts_against,
-                        short_handed_goals_for, short_handed_goals_against, percentage,
-                        percentage_full, shootout_games_played, games_played, shootout_pct,
-                        power_play_pct, shootout_pct_goals_for, shootout_pct_goals_against,
-                        penalty_kill_pct, pim_pg, power_plays, win_percentage, times_short_handed,
-                        shootout_record, home_record, visiting_record
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                               ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                               ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    cursor.execute(query, (
-                        stats_id, season_id, team_id, division_id,
-                        wins, losses, ties, ot_losses, reg_ot_losses, reg_losses, ot_wins,
-                        shootout_wins, shootout_losses, regulation_wins, row, points,
-                        bench_minutes, penalty_minutes, goals_for, goals_against, goals_diff,
-                        power_play_goals, power_play_goals_against, shootout_goals,
-                        shootout_goals_against, shootout_attempts, shootout_attempts_against,
-                        short_handed_goals_for, short_handed_goals_against, percentage,
-                        percentage_full, shootout_games_played, games_played, shootout_pct,
-                        power_play_pct, shootout_pct_goals_for, shootout_pct_goals_against,
-                        penalty_kill_pct, pim_pg, power_plays, win_percentage, times_short_handed,
-                        shootout_record, home_record, visiting_record
-                    ))
-                    logger.info(f"Inserted new team season stats for team {team_id}, season {season_id}")
+def update_season_stats_teams(conn: sqlite3.Connection, season_id: int, teams_stats: List[Dict[str, Any]],
+                              commit: bool = True) -> int:
+    """
+    Update team season statistics in the database.
 
-                updated_count += 1
+    Args:
+        conn: Database connection
+        season_id: Season ID
+        teams_stats: List of team stats dictionaries
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
-            except sqlite3.Error as e:
-                logger.error(f"Error updating team season stats for team {team_id}, season {season_id}: {e}")
-                conn.rollback()
+    Returns:
+        Number of teams updated
+    """
+    logger.info(f"Updating team season stats for season {season_id}")
 
-        except Exception as e:
-            logger.error(f"Error processing team stats: {e}")
-            continue
+    try:
+        rows = _season_team_rows(season_id, teams_stats)
+        cursor = conn.cursor()
+        _begin_immediate(cursor)
+        updated_count = _executemany_chunked(cursor, _UPSERT_SEASON_TEAMS_SQL, rows)
+    except sqlite3.Error as e:
+        logger.error(f"Error updating team season stats for season {season_id}: {e}")
+        if not commit:
+            raise
+        conn.rollback()
+        return 0
 
-    conn.commit()
+    if commit:
+        conn.commit()
     logger.info(f"Updated {updated_count} team season stats records for season {season_id}")
     return updated_count
 
@@ -356,7 +537,8 @@ def fetch_player_season_stats(client: PWHLApiClient, player_id: int) -> Optional
     Returns:
         Player stats dictionary or None if request fails
     """
-    logger.info(f"Fetching season stats for player {player_id}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Fetching season stats for player {player_id}")
 
     # Get player stats
     player_stats = client.fetch_player_season_stats(player_id)
@@ -368,466 +550,223 @@ def fetch_player_season_stats(client: PWHLApiClient, player_id: int) -> Optional
     return player_stats['SiteKit']['Player']
 
 
-def update_season_stats_skaters(conn: sqlite3.Connection, player_id: int, season_stats: Dict[str, Any]) -> int:
+def _iter_fetched(fetch: Callable[[PWHLApiClient, int], Optional[Dict[str, Any]]], client: PWHLApiClient,
+                  ids: List[int], max_workers: int) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
     """
-    Update skater season statistics in the database.
+    Run a fetch function for many IDs on a thread pool, yielding results as they complete.
 
     Args:
-        conn: Database connection
-        player_id: Player ID
-        season_stats: Dictionary of player season stats
+        fetch: Function taking (client, id) and returning a dictionary or None
+        client: PWHLApiClient instance
+        ids: List of IDs to fetch
+        max_workers: Maximum number of requests in flight at once
 
-    Returns:
-        Number of season stats records updated
+    Yields:
+        Tuples of (id, fetched dictionary or None), in completion order
     """
-    logger.info(f"Updating season stats for skater {player_id}")
-
-    updated_count = 0
-
-    # Get season stats for regular, exhibition, and playoff seasons
-    all_stats_raw = [season_stats.get(key, {}) for key in ['regular', 'exhibition', 'playoff']]
-
-    # Normalize into a flat list of stats dictionaries
-    all_stats = []
-    for s in all_stats_raw:
-        if isinstance(s, list):
-            all_stats.extend(s)
-        elif isinstance(s, dict):
-            all_stats.append(s)
-        else:
-            logger.warning("Unexpected type for season stats, skipping")
-
-    # Process each season
-    for stats in all_stats:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, client, item_id): item_id for item_id in ids}
         try:
-            # Skip "Total" entries
-            if stats.get('shortname') == 'Total':
-                continue
-
-            # Extract season ID
-            try:
-                season_id = int(stats.get('season_id', 0))
-                if not season_id:
-                    continue
-            except (ValueError, TypeError):
-                continue
-
-            # Create a unique ID for this season-player stats record
-            stats_id = f"{season_id}_{player_id}"
-
-            # Extract team info
-            try:
-                team_id = int(stats.get('team_id', 0))
-            except (ValueError, TypeError):
-                team_id = None
-
-            # Extract jersey number
-            try:
-                jersey_number = int(stats.get('jersey_number', 0))
-            except (ValueError, TypeError):
-                jersey_number = None
+            for future in as_completed(futures):
+                item_id = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error in {fetch.__name__} for {item_id}: {e}")
+                    result = None
+                yield item_id, result
+        finally:
+            # If the caller stops early, drop the queued fetches so the executor's
+            # shutdown only waits for the ones already running
+            for future in futures:
+                future.cancel()
+
+
+def iter_player_season_stats(client: PWHLApiClient, player_ids: List[int],
+                             max_workers: int = 20) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Fetch season statistics for many players on a thread pool.
 
-            # Extract handedness
-            shoots = stats.get('shoots', '')
+    Results are yielded as soon as each request completes, so the caller can
+    write them to the database on its own thread while the remaining requests
+    are still in flight. The client's rate limit still applies across threads.
 
-            # Extract basic game stats
-            try:
-                games_played = int(stats.get('games_played', 0))
-                game_winning_goals = int(stats.get('game_winning_goals', 0))
-                game_tieing_goals = int(stats.get('game_tieing_goals', 0))
-                first_goals = int(stats.get('first_goals', 0))
-                insurance_goals = int(stats.get('insurance_goals', 0))
-                unassisted_goals = int(stats.get('unassisted_goals', 0))
-                empty_net_goals = int(stats.get('empty_net_goals', 0))
-                overtime_goals = int(stats.get('overtime_goals', 0))
-            except (ValueError, TypeError):
-                games_played = game_winning_goals = game_tieing_goals = 0
-                first_goals = insurance_goals = unassisted_goals = 0
-                empty_net_goals = overtime_goals = 0
+    Args:
+        client: PWHLApiClient instance
+        player_ids: List of player IDs
+        max_workers: Maximum number of requests in flight at once
 
-            # Extract ice time
-            try:
-                ice_time = int(stats.get('ice_time', 0))
-                ice_time_avg = float(ice_time / games_played) if games_played > 0 else 0.0
-                ice_time_minutes_seconds = stats.get('ice_time_minutes_seconds', '')
-            except (ValueError, TypeError):
-                ice_time = 0
-                ice_time_avg = 0.0
-                ice_time_minutes_seconds = ''
+    Yields:
+        Tuples of (player_id, player stats dictionary or None), in completion order
+    """
+    return _iter_fetched(fetch_player_season_stats, client, player_ids, max_workers)
 
-            # Extract offensive stats
-            try:
-                goals = int(stats.get('goals', 0))
-                assists = int(stats.get('assists', 0))
-                points = int(stats.get('points', 0))
-                points_per_game = float(stats.get('points_per_game', 0))
-                plus_minus = int(stats.get('plus_minus', 0))
-                shots = int(stats.get('shots', 0))
-                shooting_percentage = float(stats.get('shooting_percentage', 0))
-            except (ValueError, TypeError):
-                goals = assists = points = plus_minus = shots = 0
-                points_per_game = shooting_percentage = 0.0
 
-            # Extract defensive stats
-            try:
-                hits = int(stats.get('hits', 0))
-                shots_blocked_by_player = int(stats.get('shots_blocked_by_player', 0))
-            except (ValueError, TypeError):
-                hits = shots_blocked_by_player = 0
+def _iter_season_entries(season_stats: Dict[str, Any]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Iterate over the per-season entries of a player's season stats.
 
-            # Extract penalty stats
-            try:
-                penalty_minutes = int(stats.get('penalty_minutes', 0))
-                penalty_minutes_per_game = float(stats.get('penalty_minutes_per_game', 0))
-                minor_penalties = int(stats.get('minor_penalties', 0))
-                major_penalties = int(stats.get('major_penalties', 0))
-            except (ValueError, TypeError):
-                penalty_minutes = minor_penalties = major_penalties = 0
-                penalty_minutes_per_game = 0.0
+    Empty entries, "Total" rows and entries without a valid season ID are
+    skipped here, before any of their stats fields are parsed.
 
-            # Extract special teams stats
-            try:
-                power_play_goals = int(stats.get('power_play_goals', 0))
-                power_play_assists = int(stats.get('power_play_assists', 0))
-                power_play_points = int(stats.get('power_play_points', 0))
-                short_handed_goals = int(stats.get('short_handed_goals', 0))
-                short_handed_assists = int(stats.get('short_handed_assists', 0))
-                short_handed_points = int(stats.get('short_handed_points', 0))
-            except (ValueError, TypeError):
-                power_play_goals = power_play_assists = power_play_points = 0
-                short_handed_goals = short_handed_assists = short_handed_points = 0
+    Args:
+        season_stats: Dictionary of player season stats
 
-            # Extract shootout stats
-            try:
-                shootout_goals = int(stats.get('shootout_goals', 0))
-                shootout_attempts = int(stats.get('shootout_attempts', 0))
-                shootout_winning_goals = int(stats.get('shootout_winning_goals', 0))
-                shootout_games_played = int(stats.get('shootout_games_played', 0))
-                shootout_percentage = float(stats.get('shootout_percentage', 0))
-            except (ValueError, TypeError):
-                shootout_goals = shootout_attempts = shootout_winning_goals = 0
-                shootout_games_played = 0
-                shootout_percentage = 0.0
+    Yields:
+        Tuples of (season_id, stats dictionary)
+    """
+    # Get season stats for regular, exhibition, and playoff seasons
+    for key in ('regular', 'exhibition', 'playoff'):
+        entries = season_stats.get(key)
+        if not entries:
+            continue
+        if isinstance(entries, dict):
+            entries = (entries,)
+        elif not isinstance(entries, list):
+            logger.warning("Unexpected type for season stats, skipping")
+            continue
 
-            # Extract faceoff stats
-            try:
-                faceoff_attempts = int(stats.get('faceoff_attempts', 0))
-                faceoff_wins = int(stats.get('faceoff_wins', 0))
-                faceoff_pct = float(stats.get('faceoff_pct', 0))
-                faceoff_wa = stats.get('faceoff_wa', '')
-            except (ValueError, TypeError):
-                faceoff_attempts = faceoff_wins = 0
-                faceoff_pct = 0.0
-                faceoff_wa = ''
+        for stats in entries:
+            if not isinstance(stats, dict) or not stats or stats.get('shortname') == 'Total':
+                continue
 
-            # Extract shots on goal
             try:
-                shots_on = int(stats.get('shots_on', 0))
+                season_id = int(stats.get('season_id', 0))
             except (ValueError, TypeError):
-                shots_on = 0
+                continue
+            if season_id:
+                yield season_id, stats
 
-            # Check if stats record exists in database
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM season_stats_skaters WHERE id = ?", (stats_id,))
-            exists = cursor.fetchone()
 
-            try:
-                if exists:
-                    # Update existing stats
-                    query = """
-                    UPDATE season_stats_skaters 
-                    SET team_id = ?, jersey_number = ?, shoots = ?, games_played = ?,
-                        game_winning_goals = ?, game_tieing_goals = ?, first_goals = ?,
-                        insurance_goals = ?, unassisted_goals = ?, empty_net_goals = ?,
-                        overtime_goals = ?, ice_time = ?, ice_time_avg = ?,
-                        ice_time_minutes_seconds = ?, goals = ?, assists = ?, points = ?,
-                        points_per_game = ?, plus_minus = ?, shots = ?, shooting_percentage = ?,
-                        hits = ?, shots_blocked_by_player = ?, penalty_minutes = ?,
-                        penalty_minutes_per_game = ?, minor_penalties = ?, major_penalties = ?,
-                        power_play_goals = ?, power_play_assists = ?, power_play_points = ?,
-                        short_handed_goals = ?, short_handed_assists = ?, short_handed_points = ?,
-                        shootout_goals = ?, shootout_attempts = ?, shootout_winning_goals = ?,
-                        shootout_games_played = ?, shootout_percentage = ?, faceoff_attempts = ?,
-                        faceoff_wins = ?, faceoff_pct = ?, faceoff_wa = ?, shots_on = ?
-                    WHERE id = ?
-                    """
-                    cursor.execute(query, (
-                        team_id, jersey_number, shoots, games_played,
-                        game_winning_goals, game_tieing_goals, first_goals,
-                        insurance_goals, unassisted_goals, empty_net_goals,
-                        overtime_goals, ice_time, ice_time_avg,
-                        ice_time_minutes_seconds, goals, assists, points,
-                        points_per_game, plus_minus, shots, shooting_percentage,
-                        hits, shots_blocked_by_player, penalty_minutes,
-                        penalty_minutes_per_game, minor_penalties, major_penalties,
-                        power_play_goals, power_play_assists, power_play_points,
-                        short_handed_goals, short_handed_assists, short_handed_points,
-                        shootout_goals, shootout_attempts, shootout_winning_goals,
-                        shootout_games_played, shootout_percentage, faceoff_attempts,
-                        faceoff_wins, faceoff_pct, faceoff_wa, shots_on,
-                        stats_id
-                    ))
-                    logger.info(f"Updated skater season stats for player {player_id}, season {season_id}")
-                else:
-                    # Insert new stats
-                    query = """
-                    INSERT INTO season_stats_skaters (
-                        id, player_id, season_id, team_id, jersey_number, shoots, games_played,
-                        game_winning_goals, game_tieing_goals, first_goals, insurance_goals,
-                        unassisted_goals, empty_net_goals, overtime_goals, ice_time, ice_time_avg,
-                        ice_time_minutes_seconds, goals, assists, points, points_per_game,
-                        plus_minus, shots, shooting_percentage, hits, shots_blocked_by_player,
-                        penalty_minutes, penalty_minutes_per_game, minor_penalties, major_penalties,
-                        power_play_goals, power_play_assists, power_play_points, short_handed_goals,
-                        short_handed_assists, short_handed_points, shootout_goals, shootout_attempts,
-                        shootout_winning_goals, shootout_games_played, shootout_percentage,
-                        faceoff_attempts, faceoff_wins, faceoff_pct, faceoff_wa, shots_on
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                              ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                              ?, ?, ?, ?, ?)
-                    """
-                    cursor.execute(query, (
-                        stats_id, player_id, season_id, team_id, jersey_number, shoots, games_played,
-                        game_winning_goals, game_tieing_goals, first_goals, insurance_goals,
-                        unassisted_goals, empty_net_goals, overtime_goals, ice_time, ice_time_avg,
-                        ice_time_minutes_seconds, goals, assists, points, points_per_game,
-                        plus_minus, shots, shooting_percentage, hits, shots_blocked_by_player,
-                        penalty_minutes, penalty_minutes_per_game, minor_penalties, major_penalties,
-                        power_play_goals, power_play_assists, power_play_points, short_handed_goals,
-                        short_handed_assists, short_handed_points, shootout_goals, shootout_attempts,
-                        shootout_winning_goals, shootout_games_played, shootout_percentage,
-                        faceoff_attempts, faceoff_wins, faceoff_pct, faceoff_wa, shots_on,
-                    ))
-                    logger.info(f"Inserted new skater season stats for player {player_id}, season {season_id}")
+def _season_skater_rows(player_id: int, season_stats: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Build skater season stats rows for one player.
 
-                updated_count += 1
+    Args:
+        player_id: Player ID
+        season_stats: Dictionary of player season stats
 
-            except sqlite3.Error as e:
-                logger.error(f"Error updating skater season stats for player {player_id}, season {season_id}: {e}")
-                # Don't rollback here to continue with other seasons
+    Yields:
+        Rows in season_stats_skaters column order; entries that fail to parse are logged and skipped
+    """
+    # Process each season
+    for season_id, stats in _iter_season_entries(season_stats):
+        try:
+            yield (player_id, season_id) + coerce_row(stats, _SEASON_SKATER_FIELDS)
 
         except Exception as e:
             logger.error(f"Error processing skater season stats: {e}")
             continue
 
-    conn.commit()
-    logger.info(f"Updated {updated_count} skater season stats records for player {player_id}")
-    return updated_count
-
 
-def update_season_stats_goalies(conn: sqlite3.Connection, player_id: int, season_stats: Dict[str, Any]) -> int:
+def update_season_stats_skaters(conn: sqlite3.Connection, player_id: int, season_stats: Dict[str, Any],
+                                commit: bool = True) -> int:
     """
-    Update goalie season statistics in the database.
+    Update skater season statistics in the database.
 
     Args:
         conn: Database connection
         player_id: Player ID
         season_stats: Dictionary of player season stats
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
     Returns:
         Number of season stats records updated
     """
-    logger.info(f"Updating season stats for goalie {player_id}")
-
-    updated_count = 0
-
-    # Get season stats for regular, exhibition, and playoff seasons
-    all_stats_raw = [season_stats.get(key, {}) for key in ['regular', 'exhibition', 'playoff']]
-
-    # Normalize into a flat list of stats dictionaries
-    all_stats = []
-    for s in all_stats_raw:
-        if isinstance(s, list):
-            all_stats.extend(s)
-        elif isinstance(s, dict):
-            all_stats.append(s)
-        else:
-            logger.warning("Unexpected type for season stats, skipping")
-
-    # Process each season
-    for stats in all_stats:
-        try:
-            # Skip "Total" entries
-            if stats.get('shortname') == 'Total':
-                continue
-
-            # Extract season ID
-            try:
-                season_id = int(stats.get('season_id', 0))
-                if not season_id:
-                    continue
-            except (ValueError, TypeError):
-                continue
-
-            # Create a unique ID for this season-player stats record
-            stats_id = f"{season_id}_{player_id}"
-
-            # Extract team info
-            try:
-                team_id = int(stats.get('team_id', 0))
-            except (ValueError, TypeError):
-                team_id = None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Updating season stats for skater {player_id}")
 
-            # Extract jersey number
-            try:
-                jersey_number = int(stats.get('jersey_number', 0))
-            except (ValueError, TypeError):
-                jersey_number = None
+    try:
+        rows = _season_skater_rows(player_id, season_stats)
+        cursor = conn.cursor()
+        _begin_immediate(cursor)
+        updated_count = _executemany_chunked(cursor, _UPSERT_SEASON_SKATERS_SQL, rows)
+    except sqlite3.Error as e:
+        logger.error(f"Error updating skater season stats for player {player_id}: {e}")
+        if not commit:
+            raise
+        conn.rollback()
+        return 0
 
-            # Extract handedness
-            shoots = stats.get('shoots', '')
-            catches = stats.get('catches', '')
+    if commit:
+        conn.commit()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Updated {updated_count} skater season stats records for player {player_id}")
+    return updated_count
 
-            # Extract basic game stats
-            try:
-                games_played = int(stats.get('games_played', 0))
-                has_games_played = games_played > 0
-            except (ValueError, TypeError):
-                games_played = 0
-                has_games_played = False
 
-            # Extract ice time
-            try:
-                ice_time = int(stats.get('ice_time', 0))
-                ice_time_avg = float(ice_time / games_played) if games_played > 0 else 0.0
-                minutes_played = stats.get('minutes_played', '')
-                minutes_played_g = int(ice_time / 60) if ice_time > 0 else 0
-                seconds_played = ice_time
-            except (ValueError, TypeError):
-                ice_time = 0
-                ice_time_avg = 0.0
-                minutes_played = ''
-                minutes_played_g = 0
-                seconds_played = 0
+def _season_goalie_rows(player_id: int, season_stats: Dict[str, Any]) -> Iterator[Tuple[Any, ...]]:
+    """
+    Build goalie season stats rows for one player.
 
-            # Extract save stats
-            try:
-                saves = int(stats.get('saves', 0))
-                shots = int(stats.get('shots', 0))
-                save_percentage = float(stats.get('save_percentage', 0))
-                goals_against = int(stats.get('goals_against', 0))
-                empty_net_goals_against = int(stats.get('empty_net_goals_against', 0))
-                shutouts = int(stats.get('shutouts', 0))
-            except (ValueError, TypeError):
-                saves = shots = goals_against = empty_net_goals_against = shutouts = 0
-                save_percentage = 0.0
+    Args:
+        player_id: Player ID
+        season_stats: Dictionary of player season stats
 
-            # Extract record stats
-            try:
-                wins = int(stats.get('wins', 0))
-                losses = int(stats.get('losses', 0))
-                ot_losses = int(stats.get('ot_losses', 0))
-                total_losses = losses + ot_losses
-                ot = int(stats.get('ot', 0))
-                ties = int(stats.get('ties', 0))
-            except (ValueError, TypeError):
-                wins = losses = ot_losses = total_losses = ot = ties = 0
+    Yields:
+        Rows in season_stats_goalies column order; entries that fail to parse are logged and skipped
+    """
+    # Process each season
+    for season_id, stats in _iter_season_entries(season_stats):
+        try:
+            values = coerce_row(stats, _SEASON_GOALIE_FIELDS)
+            games_played = values[_GOALIE_GP]
+            ice_time = values[_GOALIE_ICE]
+
+            yield (player_id, season_id) + values + (
+                ice_time / games_played if games_played > 0 else 0.0,  # ice_time_avg
+                games_played > 0,  # has_games_played
+                int(ice_time / 60) if ice_time > 0 else 0,  # minutes_played_g
+                ice_time,  # seconds_played
+                values[_GOALIE_LOSSES] + values[_GOALIE_OTL],  # total_losses
+                values[_GOALIE_SHOTS] / games_played if games_played > 0 else 0.0,  # shots_against_average
+            )
 
-            # Extract shootout stats
-            try:
-                shootout_games_played = int(stats.get('shootout_games_played', 0))
-                shootout_losses = int(stats.get('shootout_losses', 0))
-                shootout_wins = int(stats.get('shootout_wins', 0))
-                shootout_goals_against = int(stats.get('shootout_goals_against', 0))
-                shootout_saves = int(stats.get('shootout_saves', 0))
-                shootout_attempts = int(stats.get('shootout_attempts', 0))
-                shootout_percentage = float(stats.get('shootout_percentage', 0))
-            except (ValueError, TypeError):
-                shootout_games_played = shootout_losses = shootout_wins = 0
-                shootout_goals_against = shootout_saves = shootout_attempts = 0
-                shootout_percentage = 0.0
+        except Exception as e:
+            logger.error(f"Error processing goalie season stats: {e}")
+            continue
 
-            # Extract offensive stats (rare for goalies)
-            try:
-                goals = int(stats.get('goals', 0))
-                assists = int(stats.get('assists', 0))
-                points = int(stats.get('points', 0))
-                penalty_minutes = int(stats.get('penalty_minutes', 0))
-            except (ValueError, TypeError):
-                goals = assists = points = penalty_minutes = 0
 
-            # Extract advanced stats
-            try:
-                shots_against_average = shots / games_played if games_played > 0 else 0.0
-                goals_against_average = float(stats.get('goals_against_average', 0))
-            except (ValueError, TypeError):
-                shots_against_average = goals_against_average = 0.0
+def update_season_stats_goalies(conn: sqlite3.Connection, player_id: int, season_stats: Dict[str, Any],
+                                commit: bool = True) -> int:
+    """
+    Update goalie season statistics in the database.
 
-            # Check if stats record exists in database
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM season_stats_goalies WHERE id = ?", (stats_id,))
-            exists = cursor.fetchone()
+    Args:
+        conn: Database connection
+        player_id: Player ID
+        season_stats: Dictionary of player season stats
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
-            try:
-                if exists:
-                    # Update existing stats
-                    query = """
-                    UPDATE season_stats_goalies
-                    SET team_id = ?, jersey_number = ?, shoots = ?, catches = ?, games_played = ?,
-                        ice_time = ?, ice_time_avg = ?, has_games_played = ?, minutes_played = ?,
-                        minutes_played_g = ?, seconds_played = ?, saves = ?, shots = ?,
-                        save_percentage = ?, goals_against = ?, empty_net_goals_against = ?,
-                        shutouts = ?, wins = ?, losses = ?, ot_losses = ?, total_losses = ?,
-                        shootout_games_played = ?, shootout_losses = ?, shootout_wins = ?,
-                        shootout_goals_against = ?, shootout_saves = ?, shootout_attempts = ?,
-                        goals = ?, assists = ?, points = ?, penalty_minutes = ?,
-                        shootout_percentage = ?, ot = ?, ties = ?, shots_against_average = ?,
-                        goals_against_average = ?
-                    WHERE id = ?
-                    """
-                    cursor.execute(query, (
-                        team_id, jersey_number, shoots, catches, games_played,
-                        ice_time, ice_time_avg, has_games_played, minutes_played,
-                        minutes_played_g, seconds_played, saves, shots,
-                        save_percentage, goals_against, empty_net_goals_against,
-                        shutouts, wins, losses, ot_losses, total_losses,
-                        shootout_games_played, shootout_losses, shootout_wins,
-                        shootout_goals_against, shootout_saves, shootout_attempts,
-                        goals, assists, points, penalty_minutes,
-                        shootout_percentage, ot, ties, shots_against_average,
-                        goals_against_average,
-                        stats_id
-                    ))
-                    logger.info(f"Updated goalie season stats for player {player_id}, season {season_id}")
-                else:
-                    # Insert new stats
-                    query = """
-                    INSERT INTO season_stats_goalies (
-                        id, player_id, season_id, team_id, jersey_number, shoots, catches,
-                        games_played, ice_time, ice_time_avg, has_games_played, minutes_played,
-                        minutes_played_g, seconds_played, saves, shots, save_percentage,
-                        goals_against, empty_net_goals_against, shutouts, wins, losses,
-                        ot_losses, total_losses, shootout_games_played, shootout_losses,
-                        shootout_wins, shootout_goals_against, shootout_saves, shootout_attempts,
-                        goals, assists, points, penalty_minutes, shootout_percentage, ot, ties,
-                        shots_against_average, goals_against_average
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                              ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    cursor.execute(query, (
-                        stats_id, player_id, season_id, team_id, jersey_number, shoots, catches,
-                        games_played, ice_time, ice_time_avg, has_games_played, minutes_played,
-                        minutes_played_g, seconds_played, saves, shots, save_percentage,
-                        goals_against, empty_net_goals_against, shutouts, wins, losses,
-                        ot_losses, total_losses, shootout_games_played, shootout_losses,
-                        shootout_wins, shootout_goals_against, shootout_saves, shootout_attempts,
-                        goals, assists, points, penalty_minutes, shootout_percentage, ot, ties,
-                        shots_against_average, goals_against_average,
-                    ))
-                    logger.info(f"Inserted new goalie season stats for player {player_id}, season {season_id}")
+    Returns:
+        Number of season stats records updated
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Updating season stats for goalie {player_id}")
 
-                updated_count += 1
+    try:
+        cursor = conn.cursor()
 
-            except sqlite3.Error as e:
-                logger.error(f"Error updating goalie season stats for player {player_id}, season {season_id}: {e}")
-                # Don't rollback here to continue with other seasons
+        # Re-scrapes mostly return unchanged seasons; only write rows whose fingerprint changed
+        cursor.execute(_SELECT_SEASON_GOALIE_HASHES_SQL, (player_id,))
+        stored_hashes = dict(cursor.fetchall())
+        rows = _changed_rows(_season_goalie_rows(player_id, season_stats), stored_hashes, key_index=1)
 
-        except Exception as e:
-            logger.error(f"Error processing goalie season stats: {e}")
-            continue
+        _begin_immediate(cursor)
+        updated_count = _executemany_chunked(cursor, _UPSERT_SEASON_GOALIES_SQL, rows)
+    except sqlite3.Error as e:
+        logger.error(f"Error updating goalie season stats for player {player_id}: {e}")
+        if not commit:
+            raise
+        conn.rollback()
+        return 0
 
-    conn.commit()
-    logger.info(f"Updated {updated_count} goalie season stats records for player {player_id}")
+    if commit:
+        conn.commit()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Updated {updated_count} goalie season stats records for player {player_id}")
     return updated_count
 
 
@@ -861,7 +800,176 @@ def fetch_game_stats(client: PWHLApiClient, game_id: int) -> Optional[Dict[str,
     return game_data['GC']['Gamesummary']
 
 
-def update_game_stats_teams(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any]) -> int:
+def iter_game_stats(client: PWHLApiClient, game_ids: List[int],
+                    max_workers: int = 20) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Fetch statistics for many games on a thread pool.
+
+    Like iter_player_season_stats, results are yielded as each request
+    completes so the caller can keep all database writes on its own thread.
+
+    Args:
+        client: PWHLApiClient instance
+        game_ids: List of game IDs
+        max_workers: Maximum number of requests in flight at once
+
+    Yields:
+        Tuples of (game_id, game stats dictionary or None), in completion order
+    """
+    return _iter_fetched(fetch_game_stats, client, game_ids, max_workers)
+
+
+def _game_ids(game_id: int, meta: Dict[str, Any]) -> Optional[Tuple[int, int, int]]:
+    """
+    Read a game's season, home team and visitor team IDs from its metadata.
+
+    Args:
+        game_id: Game ID, used in log messages
+        meta: Game metadata dictionary
+
+    Returns:
+        Tuple of (season_id, home_team_id, visitor_team_id), or None if any is missing or invalid
+    """
+    ids = []
+    for key, label in _GAME_ID_KEYS:
+        try:
+            ids.append(int(meta[key]))
+        except (KeyError, ValueError, TypeError):
+            logger.warning(f"Could not determine {label} for game {game_id}")
+            return None
+    return tuple(ids)
+
+
+def _game_team_row(game_id: int, season_id: int, game_stats: Dict[str, Any], side: str) -> Tuple[Any, ...]:
+    """
+    Build the team game stats row for one side of a game.
+
+    Args:
+        game_id: Game ID
+        season_id: Season ID
+        game_stats: Game stats dictionary
+        side: "home" or "visitor"
+
+    Returns:
+        Row in game_stats_teams column order
+
+    Raises:
+        KeyError, ValueError, TypeError: If the team's stats are missing or invalid
+    """
+    team_key, goals_key = _GAME_TEAM_META_KEYS[side]
+    meta = game_stats.get('meta', {})
+    sbp = game_stats['shotsByPeriod'][side]
+    return (
+        game_id, int(meta[team_key]), season_id,
+        int(meta[goals_key]),
+        int(sbp['1']) + int(sbp['2']) + int(sbp['3']),
+        int(game_stats['powerPlayCount'][side]),
+        int(game_stats['powerPlayGoals'][side]),
+        int(game_stats['totalFaceoffs'][side]['won']),
+        int(game_stats['totalHits'][side]),
+    )
+
+
+def _game_skater_rows(game_id: int, season_id: int, team_id: int, skaters: List[Dict[str, Any]],
+                      side: str) -> List[Tuple[Any, ...]]:
+    """
+    Build skater game stats rows for one team's lineup.
+
+    Args:
+        game_id: Game ID
+        season_id: Season ID
+        team_id: Team ID of the lineup
+        skaters: Skaters from the team's lineup
+        side: "home" or "visitor", used in log messages
+
+    Returns:
+        Rows in game_stats_skaters column order; skaters that fail to parse are skipped
+    """
+    rows = []
+    for skater in skaters:
+        try:
+            player_id = int(skater['player_id'])
+
+            # Extract jersey number
+            jersey_number = _safe_int(skater, 'jersey_number', None)
+
+            # Extract position and status
+            position = skater['position_str']
+            rookie = skater['rookie'] == '1'
+            start = skater['start'] == '1'
+            status = skater['status']
+
+            # Extract game stats; plusminus arrives signed, e.g. "+2"
+            stats = _safe_ints(skater, _GAME_SKATER_INT_KEYS)
+            game_winning_goal = skater.get('game_winning_goal', 0) == 1
+
+            rows.append((
+                game_id, player_id, team_id, season_id, jersey_number,
+                position, rookie, start, status
+            ) + stats + (game_winning_goal,))
+
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Error processing {side} skater {skater.get('player_id')} stats for game {game_id}: {e}")
+            continue
+
+    return rows
+
+
+def _game_goalie_rows(game_id: int, season_id: int, team_id: int, goalies: List[Dict[str, Any]],
+                      side: str) -> List[Tuple[Any, ...]]:
+    """
+    Build goalie game stats rows for one team's lineup.
+
+    Args:
+        game_id: Game ID
+        season_id: Season ID
+        team_id: Team ID of the lineup
+        goalies: Goalies from the team's lineup
+        side: "home" or "visitor", used in log messages
+
+    Returns:
+        Rows in game_stats_goalies column order; goalies without ice time or that fail to parse are skipped
+    """
+    rows = []
+    for goalie in goalies:
+        # Skip goalies with no ice time before parsing anything else
+        if goalie.get('seconds') in _NO_ICE_TIME:
+            continue
+
+        try:
+            player_id = int(goalie['player_id'])
+
+            # Extract jersey number
+            jersey_number = _safe_int(goalie, 'jersey_number', None)
+
+            # Extract position and status
+            position = goalie['position_str']
+            rookie = goalie['rookie'] == '1'
+            start = goalie['start'] == '1'
+            status = goalie['status']
+
+            # Extract time and goalie stats
+            time = goalie.get('time', '')
+            (seconds, shots_against, goals_against, saves,
+             goals, assists, pim, shots) = _safe_ints(goalie, _GAME_GOALIE_INT_KEYS)
+
+            rows.append((
+                game_id, player_id, team_id, season_id, jersey_number,
+                position, rookie, start, status, seconds, time,
+                shots_against, goals_against, saves, goals, assists, pim, shots
+            ))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Saving goalie game stats for player {player_id} in game {game_id}")
+
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"Error processing {side} goalie {goalie.get('player_id')} stats for game {game_id}: {e}")
+            continue
+
+    return rows
+
+
+def update_game_stats_teams(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any],
+                            commit: bool = True) -> int:
     """
     Update team game statistics in the database.
 
@@ -869,6 +977,8 @@ def update_game_stats_teams(conn: sqlite3.Connection, game_id: int, game_stats:
         conn: Database connection
         game_id: Game ID
         game_stats: Game stats dictionary
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
     Returns:
         Number of team stats records updated
@@ -876,129 +986,41 @@ def update_game_stats_teams(conn: sqlite3.Connection, game_id: int, game_stats:
     logger.info(f"Updating team game stats for game {game_id}")
 
     updated_count = 0
+    cursor = conn.cursor()
 
     try:
+        meta = game_stats.get('meta', {})
+
         # Extract season ID
         try:
-            season_id = int(game_stats['meta']['season_id'])
+            season_id = int(meta['season_id'])
         except (KeyError, ValueError, TypeError):
             logger.warning(f"Could not determine season ID for game {game_id}")
             return 0
 
-        # Extract home team stats
-        try:
-            home_team_id = int(game_stats['meta']['home_team'])
-            home_goals = int(game_stats['meta']['home_goal_count'])
-            home_shots = int(game_stats['shotsByPeriod']['home']['1']) + int(
-                game_stats['shotsByPeriod']['home']['2']) + int(game_stats['shotsByPeriod']['home']['3'])
-            home_pp_total = int(game_stats['powerPlayCount']['home'])
-            home_pp_goals = int(game_stats['powerPlayGoals']['home'])
-            home_fow = int(game_stats['totalFaceoffs']['home']['won'])
-            home_hits = int(game_stats['totalHits']['home'])
-
-            # Create a unique ID for home team game stats
-            home_stats_id = f"{game_id}_home_{home_team_id}"
-
-            # Check if home team stats record exists
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM game_stats_teams WHERE id = ?", (home_stats_id,))
-            exists = cursor.fetchone()
-
-            if exists:
-                # Update existing home team stats
-                query = """
-                UPDATE game_stats_teams
-                SET season_id = ?, goals = ?, shots_on_goal = ?, power_play_total = ?,
-                    power_play_goals = ?, fow = ?, hits = ?
-                WHERE id = ?
-                """
-                cursor.execute(query, (
-                    season_id, home_goals, home_shots, home_pp_total,
-                    home_pp_goals, home_fow, home_hits,
-                    home_stats_id
-                ))
-                logger.info(f"Updated home team game stats for game {game_id}")
-            else:
-                # Insert new home team stats
-                query = """
-                INSERT INTO game_stats_teams (
-                    id, game_id, team_id, season_id, goals, shots_on_goal,
-                    power_play_total, power_play_goals, fow, hits
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                cursor.execute(query, (
-                    home_stats_id, game_id, home_team_id, season_id, home_goals, home_shots,
-                    home_pp_total, home_pp_goals, home_fow, home_hits
-                ))
-                logger.info(f"Inserted new home team game stats for game {game_id}")
-
-            updated_count += 1
-
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Error processing home team stats for game {game_id}: {e}")
-
-        # Extract visitor team stats
-        try:
-            visitor_team_id = int(game_stats['meta']['visiting_team'])
-            visitor_goals = int(game_stats['meta']['visiting_goal_count'])
-            visitor_shots = int(game_stats['shotsByPeriod']['visitor']['1']) + int(
-                game_stats['shotsByPeriod']['visitor']['2']) + int(game_stats['shotsByPeriod']['visitor']['3'])
-            visitor_pp_total = int(game_stats['powerPlayCount']['visitor'])
-            visitor_pp_goals = int(game_stats['powerPlayGoals']['visitor'])
-            visitor_fow = int(game_stats['totalFaceoffs']['visitor']['won'])
-            visitor_hits = int(game_stats['totalHits']['visitor'])
-
-            # Create a unique ID for visitor team game stats
-            visitor_stats_id = f"{game_id}_visitor_{visitor_team_id}"
-
-            # Check if visitor team stats record exists
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM game_stats_teams WHERE id = ?", (visitor_stats_id,))
-            exists = cursor.fetchone()
-
-            if exists:
-                # Update existing visitor team stats
-                query = """
-                UPDATE game_stats_teams
-                SET season_id = ?, goals = ?, shots_on_goal = ?, power_play_total = ?,
-                    power_play_goals = ?, fow = ?, hits = ?
-                WHERE id = ?
-                """
-                cursor.execute(query, (
-                    season_id, visitor_goals, visitor_shots, visitor_pp_total,
-                    visitor_pp_goals, visitor_fow, visitor_hits,
-                    visitor_stats_id
-                ))
-                logger.info(f"Updated visitor team game stats for game {game_id}")
-            else:
-                # Insert new visitor team stats
-                query = """
-                INSERT INTO game_stats_teams (
-                    id, game_id, team_id, season_id, goals, shots_on_goal,
-                    power_play_total, power_play_goals, fow, hits
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                cursor.execute(query, (
-                    visitor_stats_id, game_id, visitor_team_id, season_id, visitor_goals, visitor_shots,
-                    visitor_pp_total, visitor_pp_goals, visitor_fow, visitor_hits
-                ))
-                logger.info(f"Inserted new visitor team game stats for game {game_id}")
-
-            updated_count += 1
+        # Process home then visitor team stats
+        for side in ('home', 'visitor'):
+            try:
+                cursor.execute(_UPSERT_GAME_TEAMS_SQL, _game_team_row(game_id, season_id, game_stats, side))
+                updated_count += 1
 
-        except (KeyError, ValueError, TypeError) as e:
-            logger.warning(f"Error processing visitor team stats for game {game_id}: {e}")
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Error processing {side} team stats for game {game_id}: {e}")
 
-        conn.commit()
+        if commit:
+            conn.commit()
 
-    except Exception as e:
+    except sqlite3.Error as e:
         logger.error(f"Error updating team game stats for game {game_id}: {e}")
+        if not commit:
+            raise
         conn.rollback()
 
     return updated_count
 
 
-def update_game_stats_skaters(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any]) -> int:
+def update_game_stats_skaters(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any],
+                              commit: bool = True) -> int:
     """
     Update skater game statistics in the database.
 
@@ -1006,6 +1028,8 @@ def update_game_stats_skaters(conn: sqlite3.Connection, game_id: int, game_stats
         conn: Database connection
         game_id: Game ID
         game_stats: Game stats dictionary
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
     Returns:
         Number of skater stats records updated
@@ -1013,277 +1037,42 @@ def update_game_stats_skaters(conn: sqlite3.Connection, game_id: int, game_stats
     logger.info(f"Updating skater game stats for game {game_id}")
 
     updated_count = 0
+    cursor = conn.cursor()
 
     try:
-        # Extract season ID
-        try:
-            season_id = int(game_stats['meta']['season_id'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine season ID for game {game_id}")
+        ids = _game_ids(game_id, game_stats.get('meta', {}))
+        if ids is None:
             return 0
+        season_id, home_team_id, visitor_team_id = ids
 
-        # Extract home team ID
-        try:
-            home_team_id = int(game_stats['meta']['home_team'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine home team ID for game {game_id}")
-            return 0
+        _begin_immediate(cursor)
 
-        # Extract visitor team ID
-        try:
-            visitor_team_id = int(game_stats['meta']['visiting_team'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine visitor team ID for game {game_id}")
-            return 0
-
-        # Process home team skaters
-        try:
-            home_skaters = [player for player in game_stats['home_team_lineup']['players']
-                            if player['position_str'] != 'G']
-
-            for skater in home_skaters:
-                try:
-                    player_id = int(skater['player_id'])
-
-                    # Create a unique ID for this skater game stats record
-                    stats_id = f"{game_id}_{player_id}"
-
-                    # Extract jersey number
-                    try:
-                        jersey_number = int(skater['jersey_number'])
-                    except (ValueError, TypeError):
-                        jersey_number = None
-
-                    # Extract position and status
-                    position = skater['position_str']
-                    rookie = skater['rookie'] == '1'
-                    start = skater['start'] == '1'
-                    status = skater['status']
-
-                    # Extract game stats
-                    try:
-                        goals = int(skater['goals'])
-                        assists = int(skater['assists'])
-                        try:
-                            plusminus = int(str(skater.get('plusminus', '')).replace('+', ''))
-                        except (ValueError, TypeError):
-                            plusminus = 0
-                        pim = int(skater['pim'])
-                    except (ValueError, TypeError):
-                        goals = assists = plusminus = pim = 0
-
-                    # Extract faceoff stats
-                    try:
-                        faceoff_wins = int(skater['faceoff_wins'])
-                        faceoff_attempts = int(skater['faceoff_attempts'])
-                    except (ValueError, TypeError):
-                        faceoff_wins = faceoff_attempts = 0
-
-                    # Extract other stats
-                    try:
-                        hits = int(skater['hits'])
-                        shots = int(skater['shots'])
-                        shots_on = int(skater['shots_on'])
-                        shots_blocked_by_player = int(skater['shots_blocked_by_player'])
-                        shots_blocked = int(skater['shots_blocked'])
-                    except (ValueError, TypeError):
-                        hits = shots = shots_on = shots_blocked_by_player = shots_blocked = 0
-
-                    # Extract special teams and game-winning goal info
-                    try:
-                        power_play_goals = int(skater.get('power_play_goals', 0))
-                        short_handed_goals = int(skater.get('short_handed_goals', 0))
-                        game_winning_goal = skater.get('game_winning_goal', 0) == 1
-                    except (ValueError, TypeError):
-                        power_play_goals = short_handed_goals = 0
-                        game_winning_goal = False
-
-                    # Check if stats record exists in database
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM game_stats_skaters WHERE id = ?", (stats_id,))
-                    exists = cursor.fetchone()
-
-                    if exists:
-                        # Update existing stats
-                        query = """
-                        UPDATE game_stats_skaters
-                        SET season_id = ?, team_id = ?, jersey_number = ?, position = ?,
-                            rookie = ?, start = ?, status = ?, goals = ?, assists = ?,
-                            plusminus = ?, pim = ?, faceoff_wins = ?, faceoff_attempts = ?,
-                            hits = ?, shots = ?, shots_on = ?, shots_blocked_by_player = ?,
-                            shots_blocked = ?, power_play_goals = ?, short_handed_goals = ?,
-                            game_winning_goal = ?
-                        WHERE id = ?
-                        """
-                        cursor.execute(query, (
-                            season_id, home_team_id, jersey_number, position,
-                            rookie, start, status, goals, assists,
-                            plusminus, pim, faceoff_wins, faceoff_attempts,
-                            hits, shots, shots_on, shots_blocked_by_player,
-                            shots_blocked, power_play_goals, short_handed_goals,
-                            game_winning_goal,
-                            stats_id
-                        ))
-                        logger.info(f"Updated skater game stats for player {player_id} in game {game_id}")
-                    else:
-                        # Insert new stats
-                        query = """
-                        INSERT INTO game_stats_skaters (
-                            id, game_id, player_id, team_id, season_id, jersey_number,
-                            position, rookie, start, status, goals, assists, plusminus,
-                            pim, faceoff_wins, faceoff_attempts, hits, shots, shots_on,
-                            shots_blocked_by_player, shots_blocked, power_play_goals,
-                            short_handed_goals, game_winning_goal
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(query, (
-                            stats_id, game_id, player_id, home_team_id, season_id, jersey_number,
-                            position, rookie, start, status, goals, assists, plusminus,
-                            pim, faceoff_wins, faceoff_attempts, hits, shots, shots_on,
-                            shots_blocked_by_player, shots_blocked, power_play_goals,
-                            short_handed_goals, game_winning_goal
-                        ))
-                        logger.info(f"Inserted new skater game stats for player {player_id} in game {game_id}")
-
-                    updated_count += 1
-
-                except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Error processing home skater {skater.get('player_id')} stats for game {game_id}: {e}")
-                    continue
-
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Error processing home team skaters for game {game_id}: {e}")
-
-        # Process visitor team skaters
-        try:
-            visitor_skaters = [player for player in game_stats['visitor_team_lineup']['players']
-                               if player['position_str'] != 'G']
+        # Process home then visitor team skaters
+        for side, team_id in (('home', home_team_id), ('visitor', visitor_team_id)):
+            try:
+                skaters = [player for player in game_stats[f'{side}_team_lineup']['players']
+                           if player['position_str'] != 'G']
+                rows = _game_skater_rows(game_id, season_id, team_id, skaters, side)
+                cursor.executemany(_UPSERT_GAME_SKATERS_SQL, rows)
+                updated_count += len(rows)
 
-            for skater in visitor_skaters:
-                try:
-                    player_id = int(skater['player_id'])
-
-                    # Create a unique ID for this skater game stats record
-                    stats_id = f"{game_id}_{player_id}"
-
-                    # Extract jersey number
-                    try:
-                        jersey_number = int(skater['jersey_number'])
-                    except (ValueError, TypeError):
-                        jersey_number = None
-
-                    # Extract position and status
-                    position = skater['position_str']
-                    rookie = skater['rookie'] == '1'
-                    start = skater['start'] == '1'
-                    status = skater['status']
-
-                    # Extract game stats
-                    try:
-                        goals = int(skater['goals'])
-                        assists = int(skater['assists'])
-                        try:
-                            plusminus = int(str(skater.get('plusminus', '')).replace('+', ''))
-                        except (ValueError, TypeError):
-                            plusminus = 0
-                        pim = int(skater['pim'])
-                    except (ValueError, TypeError):
-                        goals = assists = plusminus = pim = 0
-
-                    # Extract faceoff stats
-                    try:
-                        faceoff_wins = int(skater['faceoff_wins'])
-                        faceoff_attempts = int(skater['faceoff_attempts'])
-                    except (ValueError, TypeError):
-                        faceoff_wins = faceoff_attempts = 0
-
-                    # Extract other stats
-                    try:
-                        hits = int(skater['hits'])
-                        shots = int(skater['shots'])
-                        shots_on = int(skater['shots_on'])
-                        shots_blocked_by_player = int(skater['shots_blocked_by_player'])
-                        shots_blocked = int(skater['shots_blocked'])
-                    except (ValueError, TypeError):
-                        hits = shots = shots_on = shots_blocked_by_player = shots_blocked = 0
-
-                    # Extract special teams and game-winning goal info
-                    try:
-                        power_play_goals = int(skater.get('power_play_goals', 0))
-                        short_handed_goals = int(skater.get('short_handed_goals', 0))
-                        game_winning_goal = skater.get('game_winning_goal', 0) == 1
-                    except (ValueError, TypeError):
-                        power_play_goals = short_handed_goals = 0
-                        game_winning_goal = False
-
-                    # Check if stats record exists in database
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM game_stats_skaters WHERE id = ?", (stats_id,))
-                    exists = cursor.fetchone()
-
-                    if exists:
-                        # Update existing stats
-                        query = """
-                        UPDATE game_stats_skaters
-                        SET season_id = ?, team_id = ?, jersey_number = ?, position = ?,
-                            rookie = ?, start = ?, status = ?, goals = ?, assists = ?,
-                            plusminus = ?, pim = ?, faceoff_wins = ?, faceoff_attempts = ?,
-                            hits = ?, shots = ?, shots_on = ?, shots_blocked_by_player = ?,
-                            shots_blocked = ?, power_play_goals = ?, short_handed_goals = ?,
-                            game_winning_goal = ?
-                        WHERE id = ?
-                        """
-                        cursor.execute(query, (
-                            season_id, visitor_team_id, jersey_number, position,
-                            rookie, start, status, goals, assists,
-                            plusminus, pim, faceoff_wins, faceoff_attempts,
-                            hits, shots, shots_on, shots_blocked_by_player,
-                            shots_blocked, power_play_goals, short_handed_goals,
-                            game_winning_goal,
-                            stats_id
-                        ))
-                        logger.info(f"Updated skater game stats for player {player_id} in game {game_id}")
-                    else:
-                        # Insert new stats
-                        query = """
-                        INSERT INTO game_stats_skaters (
-                            id, game_id, player_id, team_id, season_id, jersey_number,
-                            position, rookie, start, status, goals, assists, plusminus,
-                            pim, faceoff_wins, faceoff_attempts, hits, shots, shots_on,
-                            shots_blocked_by_player, shots_blocked, power_play_goals,
-                            short_handed_goals, game_winning_goal
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(query, (
-                            stats_id, game_id, player_id, visitor_team_id, season_id, jersey_number,
-                            position, rookie, start, status, goals, assists, plusminus,
-                            pim, faceoff_wins, faceoff_attempts, hits, shots, shots_on,
-                            shots_blocked_by_player, shots_blocked, power_play_goals,
-                            short_handed_goals, game_winning_goal
-                        ))
-                        logger.info(f"Inserted new skater game stats for player {player_id} in game {game_id}")
-
-                    updated_count += 1
-
-                except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Error processing visitor skater {skater.get('player_id')} stats for game {game_id}: {e}")
-                    continue
-
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Error processing visitor team skaters for game {game_id}: {e}")
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error processing {side} team skaters for game {game_id}: {e}")
 
-        conn.commit()
+        if commit:
+            conn.commit()
 
-    except Exception as e:
+    except sqlite3.Error as e:
         logger.error(f"Error updating skater game stats for game {game_id}: {e}")
+        if not commit:
+            raise
         conn.rollback()
 
     return updated_count
 
 
-def update_game_stats_goalies(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any]) -> int:
+def update_game_stats_goalies(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any],
+                              commit: bool = True) -> int:
     """
     Update goalie game statistics in the database.
 
@@ -1291,6 +1080,8 @@ def update_game_stats_goalies(conn: sqlite3.Connection, game_id: int, game_stats
         conn: Database connection
         game_id: Game ID
         game_stats: Game stats dictionary
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
 
     Returns:
         Number of goalie stats records updated
@@ -1298,253 +1089,149 @@ def update_game_stats_goalies(conn: sqlite3.Connection, game_id: int, game_stats
     logger.info(f"Updating goalie game stats for game {game_id}")
 
     updated_count = 0
+    cursor = conn.cursor()
 
     try:
-        # Extract season ID
-        try:
-            season_id = int(game_stats['meta']['season_id'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine season ID for game {game_id}")
+        ids = _game_ids(game_id, game_stats.get('meta', {}))
+        if ids is None:
             return 0
+        season_id, home_team_id, visitor_team_id = ids
 
-        # Extract home team ID
-        try:
-            home_team_id = int(game_stats['meta']['home_team'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine home team ID for game {game_id}")
-            return 0
+        _begin_immediate(cursor)
 
-        # Extract visitor team ID
-        try:
-            visitor_team_id = int(game_stats['meta']['visiting_team'])
-        except (KeyError, ValueError, TypeError):
-            logger.warning(f"Could not determine visitor team ID for game {game_id}")
+        # Process home then visitor team goalies
+        for side, team_id in (('home', home_team_id), ('visitor', visitor_team_id)):
+            try:
+                goalies = game_stats[f'{side}_team_lineup']['goalies']
+                rows = _game_goalie_rows(game_id, season_id, team_id, goalies, side)
+                cursor.executemany(_UPSERT_GAME_GOALIES_SQL, rows)
+                updated_count += len(rows)
+
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error processing {side} team goalies for game {game_id}: {e}")
+
+        logger.info(f"Updated {updated_count} goalie game stats records for game {game_id}")
+
+        if commit:
+            conn.commit()
+
+    except sqlite3.Error as e:
+        logger.error(f"Error updating goalie game stats for game {game_id}: {e}")
+        if not commit:
+            raise
+        conn.rollback()
+
+    return updated_count
+
+
+def update_game_stats_all(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any],
+                          commit: bool = True) -> int:
+    """
+    Update team, skater and goalie game statistics in one pass over the game.
+
+    Equivalent to calling update_game_stats_teams, update_game_stats_skaters
+    and update_game_stats_goalies, but the game's IDs are read once, each
+    lineup is walked once, and each table gets a single executemany.
+
+    Args:
+        conn: Database connection
+        game_id: Game ID
+        game_stats: Game stats dictionary
+        commit: Whether to commit when done; pass False to let the caller batch commits,
+            in which case errors are re-raised for the caller to roll back
+
+    Returns:
+        Number of stats records updated
+    """
+    logger.info(f"Updating game stats for game {game_id}")
+
+    updated_count = 0
+    cursor = conn.cursor()
+
+    try:
+        ids = _game_ids(game_id, game_stats.get('meta', {}))
+        if ids is None:
             return 0
+        season_id, home_team_id, visitor_team_id = ids
 
-        # Process home team goalies
-        try:
-            home_goalies = game_stats['home_team_lineup']['goalies']
+        team_rows = []
+        skater_rows = []
+        goalie_rows = []
+        for side, team_id in (('home', home_team_id), ('visitor', visitor_team_id)):
+            try:
+                team_rows.append(_game_team_row(game_id, season_id, game_stats, side))
+            except (KeyError, ValueError, TypeError) as e:
+                logger.warning(f"Error processing {side} team stats for game {game_id}: {e}")
 
-            for goalie in home_goalies:
-                try:
-                    player_id = int(goalie['player_id'])
-
-                    # Create a unique ID for this goalie game stats record
-                    stats_id = f"{game_id}_{player_id}"
-
-                    # Skip goalies with no ice time
-                    if goalie['seconds'] == 0:
-                        continue
-
-                    # Extract jersey number
-                    try:
-                        jersey_number = int(goalie['jersey_number'])
-                    except (ValueError, TypeError):
-                        jersey_number = None
-
-                    # Extract position and status
-                    position = goalie['position_str']
-                    rookie = goalie['rookie'] == '1'
-                    start = goalie['start'] == '1'
-                    status = goalie['status']
-
-                    # Extract time stats
-                    try:
-                        seconds = int(goalie['seconds'])
-                        time = goalie['time']
-                    except (ValueError, TypeError):
-                        seconds = 0
-                        time = ''
-
-                    # Extract goalie stats
-                    try:
-                        shots_against = int(goalie['shots_against'])
-                        goals_against = int(goalie['goals_against'])
-                        saves = int(goalie['saves'])
-                    except (ValueError, TypeError):
-                        shots_against = goals_against = saves = 0
-
-                    # Extract other stats
-                    try:
-                        goals = int(goalie['goals'])
-                        assists = int(goalie['assists'])
-                        pim = int(goalie['pim'])
-                        shots = int(goalie['shots'])
-                    except (ValueError, TypeError):
-                        goals = assists = pim = shots = 0
-
-                    # Check if stats record exists in database
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM game_stats_goalies WHERE id = ?", (stats_id,))
-                    exists = cursor.fetchone()
-
-                    if exists:
-                        # Update existing stats
-                        query = """
-                        UPDATE game_stats_goalies
-                        SET season_id = ?, team_id = ?, jersey_number = ?, position = ?,
-                            rookie = ?, start = ?, status = ?, seconds = ?, time = ?,
-                            shots_against = ?, goals_against = ?, saves = ?, goals = ?,
-                            assists = ?, pim = ?, shots = ?
-                        WHERE id = ?
-                        """
-                        cursor.execute(query, (
-                            season_id, home_team_id, jersey_number, position,
-                            rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals,
-                            assists, pim, shots,
-                            stats_id
-                        ))
-                        logger.info(f"Updated goalie game stats for player {player_id} in game {game_id}")
-                    else:
-                        # Insert new stats
-                        query = """
-                        INSERT INTO game_stats_goalies (
-                            id, game_id, player_id, team_id, season_id, jersey_number,
-                            position, rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals, assists, pim, shots
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(query, (
-                            stats_id, game_id, player_id, home_team_id, season_id, jersey_number,
-                            position, rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals, assists, pim, shots
-                        ))
-                        logger.info(f"Inserted new goalie game stats for player {player_id} in game {game_id}")
-
-                    updated_count += 1
-
-                except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Error processing home goalie {goalie.get('player_id')} stats for game {game_id}: {e}")
-                    continue
-
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Error processing home team goalies for game {game_id}: {e}")
-
-        # Process visitor team goalies
-        try:
-            visitor_goalies = game_stats['visitor_team_lineup']['goalies']
+            try:
+                lineup = game_stats[f'{side}_team_lineup']
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error processing {side} team lineup for game {game_id}: {e}")
+                continue
 
-            for goalie in visitor_goalies:
-                try:
-                    player_id = int(goalie['player_id'])
-
-                    # Create a unique ID for this goalie game stats record
-                    stats_id = f"{game_id}_{player_id}"
-
-                    # Skip goalies with no ice time
-                    if goalie['seconds'] == 0:
-                        continue
-
-                    # Extract jersey number
-                    try:
-                        jersey_number = int(goalie['jersey_number'])
-                    except (ValueError, TypeError):
-                        jersey_number = None
-
-                    # Extract position and status
-                    position = goalie['position_str']
-                    rookie = goalie['rookie'] == '1'
-                    start = goalie['start'] == '1'
-                    status = goalie['status']
-
-                    # Extract time stats
-                    try:
-                        seconds = int(goalie['seconds'])
-                        time = goalie['time']
-                    except (ValueError, TypeError):
-                        seconds = 0
-                        time = ''
-
-                    # Extract goalie stats
-                    try:
-                        shots_against = int(goalie['shots_against'])
-                        goals_against = int(goalie['goals_against'])
-                        saves = int(goalie['saves'])
-                    except (ValueError, TypeError):
-                        shots_against = goals_against = saves = 0
-
-                    # Extract other stats
-                    try:
-                        goals = int(goalie['goals'])
-                        assists = int(goalie['assists'])
-                        pim = int(goalie['pim'])
-                        shots = int(goalie['shots'])
-                    except (ValueError, TypeError):
-                        goals = assists = pim = shots = 0
-
-                    # Check if stats record exists in database
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM game_stats_goalies WHERE id = ?", (stats_id,))
-                    exists = cursor.fetchone()
-
-                    if exists:
-                        # Update existing stats
-                        query = """
-                        UPDATE game_stats_goalies
-                        SET season_id = ?, team_id = ?, jersey_number = ?, position = ?,
-                            rookie = ?, start = ?, status = ?, seconds = ?, time = ?,
-                            shots_against = ?, goals_against = ?, saves = ?, goals = ?,
-                            assists = ?, pim = ?, shots = ?
-                        WHERE id = ?
-                        """
-                        cursor.execute(query, (
-                            season_id, visitor_team_id, jersey_number, position,
-                            rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals,
-                            assists, pim, shots,
-                            stats_id
-                        ))
-                        logger.info(f"Updated goalie game stats for player {player_id} in game {game_id}")
-                    else:
-                        # Insert new stats
-                        query = """
-                        INSERT INTO game_stats_goalies (
-                            id, game_id, player_id, team_id, season_id, jersey_number,
-                            position, rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals, assists, pim, shots
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(query, (
-                            stats_id, game_id, player_id, visitor_team_id, season_id, jersey_number,
-                            position, rookie, start, status, seconds, time,
-                            shots_against, goals_against, saves, goals, assists, pim, shots
-                        ))
-                        logger.info(f"Inserted new goalie game stats for player {player_id} in game {game_id}")
-
-                    updated_count += 1
-
-                except (KeyError, ValueError, TypeError) as e:
-                    logger.warning(
-                        f"Error processing visitor goalie {goalie.get('player_id')} stats for game {game_id}: {e}")
-                    continue
-
-        except (KeyError, TypeError) as e:
-            logger.warning(f"Error processing visitor team goalies for game {game_id}: {e}")
+            try:
+                skaters = [player for player in lineup['players'] if player['position_str'] != 'G']
+                skater_rows += _game_skater_rows(game_id, season_id, team_id, skaters, side)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error processing {side} team skaters for game {game_id}: {e}")
 
-        conn.commit()
+            try:
+                goalie_rows += _game_goalie_rows(game_id, season_id, team_id, lineup['goalies'], side)
+            except (KeyError, TypeError) as e:
+                logger.warning(f"Error processing {side} team goalies for game {game_id}: {e}")
 
-    except Exception as e:
-        logger.error(f"Error updating goalie game stats for game {game_id}: {e}")
+        _begin_immediate(cursor)
+        cursor.executemany(_UPSERT_GAME_TEAMS_SQL, team_rows)
+        cursor.executemany(_UPSERT_GAME_SKATERS_SQL, skater_rows)
+        cursor.executemany(_UPSERT_GAME_GOALIES_SQL, goalie_rows)
+        updated_count = len(team_rows) + len(skater_rows) + len(goalie_rows)
+
+        if commit:
+            conn.commit()
+
+    except sqlite3.Error as e:
+        logger.error(f"Error updating game stats for game {game_id}: {e}")
+        if not commit:
+            raise
         conn.rollback()
 
     return updated_count
 
 
-def update_team_stats(db_path: str, season_id: Optional[int] = None) -> Union[int, None, Any]:
+def _update_game(conn: sqlite3.Connection, game_id: int, game_stats: Dict[str, Any]) -> int:
+    """
+    Write one game's team, skater and goalie stats without committing.
+
+    Args:
+        conn: Database connection
+        game_id: Game ID
+        game_stats: Game stats dictionary
+
+    Returns:
+        Number of stats records updated, or 0 if the game failed
+    """
+    return _in_savepoint(conn, lambda: update_game_stats_all(conn, game_id, game_stats, commit=False))
+
+
+def update_team_stats(db_path: str, season_id: Optional[int] = None,
+                      conn: Optional[sqlite3.Connection] = None,
+                      client: Optional[PWHLApiClient] = None) -> Union[int, None, Any]:
     """
     Update team statistics for all seasons or a specific season.
 
     Args:
         db_path: Path to the SQLite database
         season_id: Optional specific season ID to update
+        conn: Optional open connection to reuse; it is left open for the caller
+        client: Optional API client to reuse
 
     Returns:
         Number of teams updated
     """
-    client = PWHLApiClient()
-    conn = create_connection(db_path)
+    client = client or PWHLApiClient()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = create_connection(db_path)
     updated_count = 0
 
     try:
@@ -1565,7 +1252,7 @@ def update_team_stats(db_path: str, season_id: Optional[int] = None) -> Union[in
             seasons = get_seasons(conn)
 
             # Process each season
-            for (season_id,) in seasons:
+            for season_id in seasons:
                 logger.info(f"Processing season {season_id}")
 
                 # Fetch team stats for the season
@@ -1573,24 +1260,31 @@ def update_team_stats(db_path: str, season_id: Optional[int] = None) -> Union[in
 
                 # Update team stats in the database
                 if team_stats:
-                    season_updated = update_season_stats_teams(conn, season_id, team_stats)
+                    season_updated = _in_savepoint(
+                        conn, lambda: update_season_stats_teams(conn, season_id, team_stats, commit=False))
                     updated_count += season_updated
                     logger.info(f"Updated {season_updated} team stats for season {season_id}")
                 else:
                     logger.warning(f"No team stats found for season {season_id}")
 
+            # Commit every season at once
+            conn.commit()
+
     except Exception as e:
         logger.error(f"Error updating team stats: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return updated_count
 
 
 def update_skater_stats(db_path: str, season_id: Optional[int] = None,
-                        player_id: Optional[int] = None) -> Union[int, None, Any]:
+                        player_id: Optional[int] = None,
+                        conn: Optional[sqlite3.Connection] = None,
+                        client: Optional[PWHLApiClient] = None) -> Union[int, None, Any]:
     """
     Update skater statistics for all players or a specific player.
 
@@ -1598,12 +1292,16 @@ def update_skater_stats(db_path: str, season_id: Optional[int] = None,
         db_path: Path to the SQLite database
         season_id: Optional specific season ID to update
         player_id: Optional specific player ID to update
+        conn: Optional open connection to reuse; it is left open for the caller
+        client: Optional API client to reuse
 
     Returns:
         Number of players updated
     """
-    client = PWHLApiClient()
-    conn = create_connection(db_path)
+    client = client or PWHLApiClient()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = create_connection(db_path)
     updated_count = 0
 
     try:
@@ -1613,7 +1311,7 @@ def update_skater_stats(db_path: str, season_id: Optional[int] = None,
 
             # Check if player is a skater
             cursor = conn.cursor()
-            cursor.execute("SELECT position FROM players WHERE id = ?", (player_id,))
+            cursor.execute(_SELECT_PLAYER_POSITION_SQL, (player_id,))
             result = cursor.fetchone()
 
             if result and result[0].upper() != 'G':
@@ -1628,47 +1326,42 @@ def update_skater_stats(db_path: str, season_id: Optional[int] = None,
             else:
                 logger.info(f"Player {player_id} is not a skater, skipping")
         else:
-            # Get all players from the database
-            players = get_players(conn)
-
-            # Process each player
-            for (player_id,) in players:
-                # Check if player is a skater
-                cursor = conn.cursor()
-                cursor.execute("SELECT position FROM players WHERE id = ?", (player_id,))
-                result = cursor.fetchone()
-
-                if result and result[0].upper() != 'G':
-                    logger.info(f"Processing skater {player_id}")
-
-                    # Fetch player's season stats
-                    player_stats = fetch_player_season_stats(client, player_id)
-
-                    # Update skater stats in the database
-                    if player_stats:
-                        player_updated = update_season_stats_skaters(conn, player_id, player_stats)
-                        updated_count += player_updated
-                        logger.info(f"Updated {player_updated} skater stats for player {player_id}")
-                    else:
-                        logger.warning(f"No stats found for player {player_id}")
+            # Get the skaters to process, filtered by position in SQL
+            skater_ids = get_skater_ids(conn)
+
+            # Fetch season stats on worker threads and write each result here as
+            # it arrives, keeping all database access on this thread
+            missing_count = 0
+            for player_id, player_stats in iter_player_season_stats(client, skater_ids):
+                if player_stats:
+                    updated_count += _in_savepoint(
+                        conn, lambda: update_season_stats_skaters(conn, player_id, player_stats, commit=False))
                 else:
-                    logger.debug(f"Player {player_id} is not a skater, skipping")
+                    missing_count += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"No stats found for player {player_id}")
+
+            # Commit every player at once
+            conn.commit()
 
-                # Add a small delay to avoid overwhelming the API
-                time.sleep(0.1)
+            logger.info(f"Upserted {updated_count} skater season stats records for "
+                        f"{len(skater_ids)} skaters ({missing_count} without stats)")
 
     except Exception as e:
         logger.error(f"Error updating skater stats: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return updated_count
 
 
 def update_goalie_stats(db_path: str, season_id: Optional[int] = None,
-                        player_id: Optional[int] = None) -> Union[int, None, Any]:
+                        player_id: Optional[int] = None,
+                        conn: Optional[sqlite3.Connection] = None,
+                        client: Optional[PWHLApiClient] = None) -> Union[int, None, Any]:
     """
     Update goalie statistics for all players or a specific player.
 
@@ -1676,12 +1369,16 @@ def update_goalie_stats(db_path: str, season_id: Optional[int] = None,
         db_path: Path to the SQLite database
         season_id: Optional specific season ID to update
         player_id: Optional specific player ID to update
+        conn: Optional open connection to reuse; it is left open for the caller
+        client: Optional API client to reuse
 
     Returns:
         Number of players updated
     """
-    client = PWHLApiClient()
-    conn = create_connection(db_path)
+    client = client or PWHLApiClient()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = create_connection(db_path)
     updated_count = 0
 
     try:
@@ -1691,7 +1388,7 @@ def update_goalie_stats(db_path: str, season_id: Optional[int] = None,
 
             # Check if player is a goalie
             cursor = conn.cursor()
-            cursor.execute("SELECT position FROM players WHERE id = ?", (player_id,))
+            cursor.execute(_SELECT_PLAYER_POSITION_SQL, (player_id,))
             result = cursor.fetchone()
 
             if result and result[0] == 'G':
@@ -1706,58 +1403,57 @@ def update_goalie_stats(db_path: str, season_id: Optional[int] = None,
             else:
                 logger.info(f"Player {player_id} is not a goalie, skipping")
         else:
-            # Get all players from the database
-            players = get_players(conn)
-
-            # Process each player
-            for (player_id,) in players:
-                # Check if player is a goalie
-                cursor = conn.cursor()
-                cursor.execute("SELECT position FROM players WHERE id = ?", (player_id,))
-                result = cursor.fetchone()
-
-                if result and result[0] == 'G':
-                    logger.info(f"Processing goalie {player_id}")
-
-                    # Fetch player's season stats
-                    player_stats = fetch_player_season_stats(client, player_id)
-
-                    # Update goalie stats in the database
-                    if player_stats:
-                        player_updated = update_season_stats_goalies(conn, player_id, player_stats)
-                        updated_count += player_updated
-                        logger.info(f"Updated {player_updated} goalie stats for player {player_id}")
-                    else:
-                        logger.warning(f"No stats found for player {player_id}")
+            # Get the goalies to process, filtered by position in SQL
+            goalie_ids = get_goalie_ids(conn)
+
+            # Fetch season stats on worker threads and write each result here as
+            # it arrives, keeping all database access on this thread
+            missing_count = 0
+            for player_id, player_stats in iter_player_season_stats(client, goalie_ids):
+                if player_stats:
+                    updated_count += _in_savepoint(
+                        conn, lambda: update_season_stats_goalies(conn, player_id, player_stats, commit=False))
                 else:
-                    logger.debug(f"Player {player_id} is not a goalie, skipping")
+                    missing_count += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"No stats found for player {player_id}")
 
-                # Add a small delay to avoid overwhelming the API
-                time.sleep(0.1)
+            # Commit every player at once
+            conn.commit()
+
+            logger.info(f"Upserted {updated_count} goalie season stats records for "
+                        f"{len(goalie_ids)} goalies ({missing_count} without stats)")
 
     except Exception as e:
         logger.error(f"Error updating goalie stats: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return updated_count
 
 
-def update_game_stats(db_path: str, game_id: Optional[int] = None) -> Union[int, None, Any]:
+def update_game_stats(db_path: str, game_id: Optional[int] = None,
+                      conn: Optional[sqlite3.Connection] = None,
+                      client: Optional[PWHLApiClient] = None) -> Union[int, None, Any]:
     """
     Update game statistics for all games or a specific game.
 
     Args:
         db_path: Path to the SQLite database
         game_id: Optional specific game ID to update
+        conn: Optional open connection to reuse; it is left open for the caller
+        client: Optional API client to reuse
 
     Returns:
         Number of stats records updated
     """
-    client = PWHLApiClient()
-    conn = create_connection(db_path)
+    client = client or PWHLApiClient()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = create_connection(db_path)
     updated_count = 0
 
     try:
@@ -1770,17 +1466,8 @@ def update_game_stats(db_path: str, game_id: Optional[int] = None) -> Union[int,
 
             # Update game stats in the database
             if game_stats:
-                # Update team stats
-                team_updated = update_game_stats_teams(conn, game_id, game_stats)
-                updated_count += team_updated
-
-                # Update skater stats
-                skater_updated = update_game_stats_skaters(conn, game_id, game_stats)
-                updated_count += skater_updated
-
-                # Update goalie stats
-                goalie_updated = update_game_stats_goalies(conn, game_id, game_stats)
-                updated_count += goalie_updated
+                updated_count += _update_game(conn, game_id, game_stats)
+                conn.commit()
 
                 logger.info(f"Updated {updated_count} stats records for game {game_id}")
             else:
@@ -1789,40 +1476,36 @@ def update_game_stats(db_path: str, game_id: Optional[int] = None) -> Union[int,
             # Get all games from the database
             games = get_games(conn)
 
-            # Process each game
-            for (game_id,) in games:
-                logger.info(f"Processing game {game_id}")
+            pending = 0
 
-                # Fetch game stats
-                game_stats = fetch_game_stats(client, game_id)
+            # Fetch games on worker threads and write each one here as it arrives
+            for game_id, game_stats in iter_game_stats(client, games):
+                logger.info(f"Processing game {game_id}")
 
                 # Update game stats in the database
                 if game_stats:
-                    # Update team stats
-                    team_updated = update_game_stats_teams(conn, game_id, game_stats)
-
-                    # Update skater stats
-                    skater_updated = update_game_stats_skaters(conn, game_id, game_stats)
-
-                    # Update goalie stats
-                    goalie_updated = update_game_stats_goalies(conn, game_id, game_stats)
-
-                    game_updated = team_updated + skater_updated + goalie_updated
+                    game_updated = _update_game(conn, game_id, game_stats)
                     updated_count += game_updated
 
                     logger.info(f"Updated {game_updated} stats records for game {game_id}")
+
+                    # Commit in batches of games rather than once per game
+                    pending += 1
+                    if pending >= _GAME_COMMIT_INTERVAL:
+                        conn.commit()
+                        pending = 0
                 else:
                     logger.warning(f"No stats found for game {game_id}")
 
-                # Add a small delay to avoid overwhelming the API
-                time.sleep(0.5)
+            conn.commit()
 
     except Exception as e:
         logger.error(f"Error updating game stats: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
     return updated_count
 
@@ -1840,26 +1523,32 @@ def update_stats(db_path: str, all_stats: bool = False) -> int:
     """
     updated_count = 0
 
-    # Update team stats
-    team_updated = update_team_stats(db_path)
-    updated_count += team_updated
-    logger.info(f"Updated {team_updated} team stats records")
-
-    # Update skater stats
-    skater_updated = update_skater_stats(db_path)
-    updated_count += skater_updated
-    logger.info(f"Updated {skater_updated} skater stats records")
-
-    # Update goalie stats
-    goalie_updated = update_goalie_stats(db_path)
-    updated_count += goalie_updated
-    logger.info(f"Updated {goalie_updated} goalie stats records")
-
-    # Update game stats if requested
-    if all_stats:
-        game_updated = update_game_stats(db_path)
-        updated_count += game_updated
-        logger.info(f"Updated {game_updated} game stats records")
+    # Share one HTTP session and one connection (and its statement cache) across every update
+    with PWHLApiClient() as client:
+        conn = create_connection(db_path)
+        try:
+            # Update team stats
+            team_updated = update_team_stats(db_path, conn=conn, client=client)
+            updated_count += team_updated
+            logger.info(f"Updated {team_updated} team stats records")
+
+            # Update skater stats
+            skater_updated = update_skater_stats(db_path, conn=conn, client=client)
+            updated_count += skater_updated
+            logger.info(f"Updated {skater_updated} skater stats records")
+
+            # Update goalie stats
+            goalie_updated = update_goalie_stats(db_path, conn=conn, client=client)
+            updated_count += goalie_updated
+            logger.info(f"Updated {goalie_updated} goalie stats records")
+
+            # Update game stats if requested
+            if all_stats:
+                game_updated = update_game_stats(db_path, conn=conn, client=client)
+                updated_count += game_updated
+                logger.info(f"Updated {game_updated} game stats records")
+        finally:
+            conn.close()
 
     return updated_count
 
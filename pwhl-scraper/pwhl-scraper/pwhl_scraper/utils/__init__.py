@@ -10,7 +10,8 @@ from pwhl_scraper.utils.converters import (
     determine_team_info,
     get_period_number,
     filter_dict,
-    safe_cast
+    safe_cast,
+    coerce_row
 )
 
 __all__ = [
@@ -21,5 +22,6 @@ __all__ = [
     'determine_team_info',
     'get_period_number',
     'filter_dict',
-    'safe_cast'
+    'safe_cast',
+    'coerce_row'
 ]
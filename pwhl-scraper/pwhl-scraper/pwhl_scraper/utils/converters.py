@@ -3,10 +3,20 @@ Data conversion utilities for PWHL Scraper.
 """
 import re
 import logging
-from typing import Dict, Any, Optional, Tuple, Union
+from typing import Dict, Any, Optional, Tuple, Union, Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Team logo URLs look like ".../logos/123_5.png"; the first number is the team ID
+_LOGO_RE = re.compile(r"/logos/(\d+)_\d+\.png")
+
+# Heights look like "5' 10\"" (feet, then inches); weights like "185 lbs"
+_HEIGHT_RE = re.compile(r"(\d+)\D+(\d+)")
+_WEIGHT_RE = re.compile(r"\d+")
+
+# Period numbers for overtime and shootout period identifiers
+_PERIOD_MAP = {"OT1": 4, "4": 4, "OT2": 5, "5": 5, "OT3": 6, "6": 6, "SO": 7}
+
 
 def convert_time_to_seconds(time_string: Optional[str]) -> int:
     """
@@ -23,13 +33,13 @@ def convert_time_to_seconds(time_string: Optional[str]) -> int:
 
     try:
         parts = time_string.split(':')
-        if len(parts) == 2:
-            minutes, seconds = int(parts[0]), int(parts[1])
-            return minutes * 60 + seconds
-        elif len(parts) == 3:  # HH:MM:SS format
-            hours, minutes, seconds = int(parts[0]), int(parts[1]), int(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        return 0
+        # Only MM:SS and HH:MM:SS are valid
+        if not 2 <= len(parts) <= 3:
+            return 0
+        total = 0
+        for part in parts:
+            total = total * 60 + int(part)
+        return total
     except (ValueError, TypeError) as e:
         logger.warning(f"Error converting time '{time_string}' to seconds: {e}")
         return 0
@@ -50,20 +60,14 @@ def get_period_number(period_obj: Union[str, Dict[str, Any], int]) -> int:
     else:
         period_id = period_obj
 
-    if period_id in ("OT1", "4"):
-        return 4
-    elif period_id in ("OT2", "5"):
-        return 5
-    elif period_id in ("OT3", "6"):
-        return 6
-    elif period_id == "SO":
-        return 7
-    else:
-        try:
-            return int(period_id)
-        except (ValueError, TypeError):
-            logger.warning(f"Unknown period format: {period_obj}, defaulting to 1")
-            return 1
+    try:
+        period = _PERIOD_MAP.get(period_id)
+        if period is not None:
+            return period
+        return int(period_id)
+    except (ValueError, TypeError):
+        logger.warning(f"Unknown period format: {period_obj}, defaulting to 1")
+        return 1
 
 
 def extract_height_weight(height: Optional[str], weight: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
@@ -82,23 +86,21 @@ def extract_height_weight(height: Optional[str], weight: Optional[str]) -> Tuple
 
     # Process height
     if height:
-        try:
-            # Format typically "5' 10\""
-            feet_inches = height.replace('"', '').replace("'", ' ').strip().split()
-            if len(feet_inches) == 2:
-                feet, inches = int(feet_inches[0]), int(feet_inches[1])
-                height_cm = round((feet * 30.48) + (inches * 2.54))
-        except Exception as e:
-            logger.warning(f"Error converting height '{height}' to cm: {e}")
+        match = _HEIGHT_RE.search(height)
+        if match:
+            feet, inches = int(match.group(1)), int(match.group(2))
+            height_cm = round((feet * 30.48) + (inches * 2.54))
+        else:
+            logger.warning(f"Error converting height '{height}' to cm: no feet and inches found")
 
     # Process weight
     if weight:
-        try:
-            # Weight typically in lbs
-            weight_lbs = int(''.join(c for c in weight if c.isdigit()))
-            weight_kg = round(weight_lbs * 0.453592)
-        except Exception as e:
-            logger.warning(f"Error converting weight '{weight}' to kg: {e}")
+        # Weight typically in lbs
+        match = _WEIGHT_RE.search(weight)
+        if match:
+            weight_kg = round(int(match.group()) * 0.453592)
+        else:
+            logger.warning(f"Error converting weight '{weight}' to kg: no number found")
 
     return height_cm, weight_kg
 
@@ -140,8 +142,7 @@ def extract_team_id_from_url(team_image_url: Optional[str]) -> Optional[int]:
     if not team_image_url:
         return None
 
-    # Match pattern like "/logos/123_5.png"
-    match = re.search(r"/logos/(\d+)_\d+\.png", team_image_url)
+    match = _LOGO_RE.search(team_image_url)
     return int(match.group(1)) if match else None
 
 
@@ -185,7 +186,10 @@ def filter_dict(data: Dict[str, Any], filter_none: bool = True) -> Dict[str, Any
         Filtered dictionary
     """
     if filter_none:
-        return {k: v for k, v in data.items() if v is not None}
+        # Copying is cheaper than rebuilding when there is nothing to remove
+        if any(v is None for v in data.values()):
+            return {k: v for k, v in data.items() if v is not None}
+        return dict(data)
     return data
 
 
@@ -205,3 +209,28 @@ def safe_cast(value: Any, to_type: type, default: Any = None) -> Any:
         return to_type(value)
     except (ValueError, TypeError):
         return default
+
+
+def coerce_row(data: Dict[str, Any], spec: Sequence[Tuple[str, Callable[[Any], Any], Any]]) -> Tuple[Any, ...]:
+    """
+    Coerce selected fields of a dictionary into a tuple of typed values.
+
+    Args:
+        data: Dictionary to read values from
+        spec: Sequence of (key, cast, default) tuples, in output order
+
+    Returns:
+        Tuple of cast values, using the default for missing or invalid values
+    """
+    out = []
+    append = out.append
+    for key, cast, default in spec:
+        value = data.get(key)
+        if value is None:
+            append(default)
+            continue
+        try:
+            append(cast(value))
+        except (ValueError, TypeError):
+            append(default)
+    return tuple(out)
@@ -0,0 +1,29 @@
+"""
+Shared helpers for the test suite.
+"""
+import sqlite3
+import threading
+
+from pwhl_scraper.database.db_manager import create_schema
+
+# In-memory database holding the full schema, built once per process and
+# copied into test connections with Connection.backup()
+_TEMPLATE_CONN = None
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def template_conn() -> sqlite3.Connection:
+    """Return the schema template connection, building it on first use."""
+    global _TEMPLATE_CONN
+    with _TEMPLATE_LOCK:
+        if _TEMPLATE_CONN is None:
+            conn = sqlite3.connect(":memory:")
+            create_schema(conn)
+            _TEMPLATE_CONN = conn
+        return _TEMPLATE_CONN
+
+
+def clone_template(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Overwrite a connection's database with a copy of the schema template."""
+    template_conn().backup(conn)
+    return conn
@@ -1,6 +1,5 @@
 import unittest
-from unittest.mock import patch, MagicMock
-import json
+from types import SimpleNamespace
 from pwhl_scraper.api.client import PWHLApiClient
 
 
@@ -11,15 +10,19 @@ class TestPWHLApiClient(unittest.TestCase):
         self.client = PWHLApiClient(rate_limit=0, enable_cache=False)
 
     def test_fetch_data(self):
-        # Create a test response with our test data
+        # Create a test response with our test data; the body stays a literal
+        # since parsing it is what fetch_data is tested for
         expected_data = {"data": "test"}
+        mock_response = SimpleNamespace(text='{"data": "test"}', status_code=200)
 
-        # Mock the _get method directly
-        self.client._get = MagicMock()
-        mock_response = MagicMock()
-        mock_response.text = json.dumps(expected_data)
-        mock_response.status_code = 200
-        self.client._get.return_value = mock_response
+        # Stub the _get method directly, recording its calls
+        calls = []
+
+        def _get(*args, **kwargs):
+            calls.append((args, kwargs))
+            return mock_response
+
+        self.client._get = _get
 
         # Test method
         result = self.client.fetch_data('index.php', {'param': 'value'})
@@ -27,19 +30,25 @@ class TestPWHLApiClient(unittest.TestCase):
         # Assertions
         self.assertEqual(result, expected_data)
         # Verify the _get method was called
-        self.client._get.assert_called_once()
+        self.assertEqual(len(calls), 1)
 
     def test_fetch_basic_info(self):
-        # Mock the fetch_data method that fetch_basic_info will call
+        # Stub the fetch_data method that fetch_basic_info will call
         expected_data = {"leagues": [{"id": 1, "name": "PWHL"}]}
-        self.client.fetch_data = MagicMock(return_value=expected_data)
+        calls = []
+
+        def fetch_data(*args, **kwargs):
+            calls.append((args, kwargs))
+            return expected_data
+
+        self.client.fetch_data = fetch_data
 
         # Test the method
         result = self.client.fetch_basic_info()
 
         # Assertions
         self.assertEqual(result, expected_data)
-        self.client.fetch_data.assert_called_once()
+        self.assertEqual(len(calls), 1)
 
 
 if __name__ == '__main__':
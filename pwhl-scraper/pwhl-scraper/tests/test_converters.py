@@ -0,0 +1,62 @@
+import unittest
+
+from pwhl_scraper.utils.converters import (
+    convert_time_to_seconds, extract_height_weight, get_period_number
+)
+
+LOGGER = 'pwhl_scraper.utils.converters'
+
+
+class TestConverters(unittest.TestCase):
+
+    def test_extract_height(self):
+        # Test feet and inches with any separator between them
+        self.assertEqual(extract_height_weight("5' 10\"", None), (178, None))
+        self.assertEqual(extract_height_weight("5-10", None), (178, None))
+
+        # A height without inches is logged and left empty
+        with self.assertLogs(LOGGER, level='WARNING'):
+            self.assertEqual(extract_height_weight("6'", None), (None, None))
+
+    def test_extract_weight(self):
+        # Test that only the whole pounds are read
+        self.assertEqual(extract_height_weight(None, "185 lbs"), (None, 84))
+        self.assertEqual(extract_height_weight(None, "185.5 lbs"), (None, 84))
+
+        # A weight without a number is logged and left empty
+        with self.assertLogs(LOGGER, level='WARNING'):
+            self.assertEqual(extract_height_weight(None, "unknown"), (None, None))
+
+    def test_convert_time_to_seconds(self):
+        # Test MM:SS and HH:MM:SS times
+        self.assertEqual(convert_time_to_seconds("12:34"), 754)
+        self.assertEqual(convert_time_to_seconds("1:02:03"), 3723)
+
+        # Empty times and times with the wrong number of parts count as zero
+        self.assertEqual(convert_time_to_seconds(""), 0)
+        self.assertEqual(convert_time_to_seconds(None), 0)
+        self.assertEqual(convert_time_to_seconds("5"), 0)
+        self.assertEqual(convert_time_to_seconds("1:02:03:04"), 0)
+
+        # Non-numeric parts are logged and count as zero
+        with self.assertLogs(LOGGER, level='WARNING'):
+            self.assertEqual(convert_time_to_seconds("ab:cd"), 0)
+
+    def test_get_period_number(self):
+        # Test overtime and shootout identifiers
+        self.assertEqual(get_period_number("OT1"), 4)
+        self.assertEqual(get_period_number("OT2"), 5)
+        self.assertEqual(get_period_number("SO"), 7)
+
+        # Test regular periods as ints, strings and period objects
+        self.assertEqual(get_period_number(2), 2)
+        self.assertEqual(get_period_number("3"), 3)
+        self.assertEqual(get_period_number({"id": "OT1"}), 4)
+
+        # Unknown periods are logged and default to the first period
+        with self.assertLogs(LOGGER, level='WARNING'):
+            self.assertEqual(get_period_number("X"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
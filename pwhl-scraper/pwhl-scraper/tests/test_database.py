@@ -1,3 +1,10 @@
+"""
+Tests for the database utilities.
+
+These tests share one SQLite connection per class, and test_create_connection
+writes a database file, so under pytest-xdist they must run on a single worker:
+use --dist=loadfile (see pyproject.toml) rather than the default load mode.
+"""
 import unittest
 import os
 import sqlite3
@@ -5,30 +12,43 @@ from unittest.mock import patch, MagicMock
 import tempfile
 
 from pwhl_scraper.database.db_manager import (
-    create_connection, execute_query, fetch_all, fetch_one,
-    setup_database, create_table
+    create_connection, execute_query, execute_many, fetch_all, fetch_one,
+    setup_database, create_schema, create_table, get_tables, migrate_table
 )
+from pwhl_scraper.database.models import DB_SCHEMA
+
+from tests.helpers import clone_template
 
 
 class TestDatabase(unittest.TestCase):
 
-    def setUp(self):
-        # Create a temporary database file for testing
-        self.temp_db_fd, self.temp_db_path = tempfile.mkstemp()
-        self.conn = create_connection(self.temp_db_path)
+    @classmethod
+    def setUpClass(cls):
+        # One connection for the whole class, seeded from the schema template
+        cls.conn = sqlite3.connect(":memory:")
+        cls.conn.execute("PRAGMA foreign_keys = ON")
+        clone_template(cls.conn)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
 
     def tearDown(self):
-        # Close and remove the temporary database
-        if hasattr(self, 'conn') and self.conn:
-            self.conn.close()
-        os.close(self.temp_db_fd)
-        os.unlink(self.temp_db_path)
+        # The db_manager helpers commit, so a ROLLBACK can't undo a test's writes;
+        # copying the template back over the database gives the next test a clean slate
+        if self.conn.in_transaction:
+            self.conn.rollback()
+        clone_template(self.conn)
 
     def test_create_connection(self):
-        # Test that connection is created successfully
-        conn = create_connection(self.temp_db_path)
-        self.assertIsInstance(conn, sqlite3.Connection)
-        conn.close()
+        # Test that a connection to an on-disk database is created successfully
+        # in a temporary directory, which also removes any WAL side files
+        with tempfile.TemporaryDirectory() as temp_dir:
+            conn = create_connection(os.path.join(temp_dir, "create.db"))
+            try:
+                self.assertIsInstance(conn, sqlite3.Connection)
+            finally:
+                conn.close()
 
     def test_execute_query(self):
         # Test executing a simple query
@@ -56,8 +76,7 @@ class TestDatabase(unittest.TestCase):
         create_table(self.conn, "test_fetch",
                      "CREATE TABLE IF NOT EXISTS test_fetch (id INTEGER PRIMARY KEY, value TEXT)")
 
-        execute_query(self.conn, "INSERT INTO test_fetch (value) VALUES (?)", ("Value 1",))
-        execute_query(self.conn, "INSERT INTO test_fetch (value) VALUES (?)", ("Value 2",))
+        execute_many(self.conn, "INSERT INTO test_fetch (value) VALUES (?)", [("Value 1",), ("Value 2",)])
 
         # Test fetch_all
         results = fetch_all(self.conn, "SELECT * FROM test_fetch ORDER BY id")
@@ -80,6 +99,33 @@ class TestDatabase(unittest.TestCase):
         # Verify result
         self.assertEqual(result[0], "Single Value")
 
+    def test_schema_template(self):
+        # Test that each test starts from a copy of the full schema, without
+        # tables left behind by earlier tests
+        self.assertEqual(sorted(get_tables(self.conn)), sorted(DB_SCHEMA["tables"]))
+
+    def test_migrate_table(self):
+        # Test that a table built before the composite primary key is rebuilt with its rows
+        conn = sqlite3.connect(":memory:")
+        try:
+            create_table(conn, "season_stats_teams",
+                         "CREATE TABLE season_stats_teams (id TEXT PRIMARY KEY, season_id INTEGER, "
+                         "team_id INTEGER, wins INTEGER)")
+            execute_query(conn, "INSERT INTO season_stats_teams VALUES ('5_1', 5, 1, 10)")
+
+            create_schema(conn)
+
+            pk = [row[1] for row in conn.execute("PRAGMA table_info(season_stats_teams)") if row[5]]
+            self.assertEqual(pk, ["season_id", "team_id"])
+            row = fetch_one(conn, "SELECT season_id, team_id, wins FROM season_stats_teams")
+            self.assertEqual(row, (5, 1, 10))
+
+            # An up-to-date table is left alone
+            schema = DB_SCHEMA["tables"]["season_stats_teams"]["schema"]
+            self.assertFalse(migrate_table(conn, "season_stats_teams", schema))
+        finally:
+            conn.close()
+
     @patch('pwhl_scraper.database.db_manager.create_connection')
     def test_setup_database(self, mock_create_connection):
         # Mock the connection and cursor
@@ -89,10 +135,10 @@ class TestDatabase(unittest.TestCase):
         mock_create_connection.return_value = mock_conn
 
         # Call setup_database
-        setup_database(self.temp_db_path)
+        setup_database(":memory:")
 
         # Verify connection was created
-        mock_create_connection.assert_called_once_with(self.temp_db_path)
+        mock_create_connection.assert_called_once_with(":memory:")
         # Verify some tables were created (just check a few)
         self.assertGreater(mock_cursor.execute.call_count, 0)
 
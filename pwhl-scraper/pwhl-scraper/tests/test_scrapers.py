@@ -1,146 +1,257 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import json
+import sqlite3
+from copy import deepcopy
 
-from pwhl_scraper.api.client import PWHLApiClient
-from pwhl_scraper.scrapers.basic_info import update_leagues, update_teams
-from pwhl_scraper.scrapers.players import update_player
-from pwhl_scraper.scrapers.stats import update_season_stats_teams
+from pwhl_scraper.database.db_manager import fetch_all, fetch_one
+
+from tests.helpers import clone_template
+
+# Test data in the API's own list and dict shapes, built once at import; tests
+# pass deep copies from _fixture() so a scraper that changes its input cannot
+# leak into other tests
+_LEAGUE_FIXTURE = {
+    "id": "1",
+    "name": "Professional Women's Hockey League",
+    "short_name": "PWHL",
+    "code": "pwhl",
+    "logo_image": "https://example.com/logo.png"
+}
+
+_LEAGUES_RESPONSE = {
+    "current_league_id": "1",
+    "leagues": [_LEAGUE_FIXTURE]
+}
+
+_TEAMS_FIXTURE = [
+    {
+        "id": "1",
+        "name": "Toronto",
+        "nickname": "Toronto",
+        "code": "TOR",
+        "city": "Toronto",
+        "team_logo_url": "https://example.com/toronto.png",
+        "division_id": "1"
+    }
+]
+
+_PLAYER_FIXTURE = {
+    "player_id": "123",
+    "first_name": "Jane",
+    "last_name": "Smith",
+    "tp_jersey_number": "23",
+    "active": "1",
+    "rookie": "0",
+    "position_id": "3",
+    "position": "D",
+    "height": "5'9\"",
+    "weight": "150",
+    "birthdate": "1997-05-15",
+    "shoots": "L",
+    "catches": "",
+    "player_image": "https://example.com/jane.jpg",
+    "birthtown": "Toronto",
+    "birthprov": "ON",
+    "birthcntry": "CAN",
+    "latest_team_id": "1"
+}
+
+_TEAM_STATS_FIXTURE = [
+    {
+        "team_id": "1",
+        "division_id": "1",
+        "wins": "10",
+        "losses": "5",
+        "ties": "0",
+        "ot_losses": "2",
+        "points": "22",
+        "goals_for": "45",
+        "goals_against": "35"
+    }
+]
+
+_GOALIE_SEASON_STATS_FIXTURE = {
+    "regular": [
+        {
+            "season_id": "5",
+            "team_id": "1",
+            "games_played": "10",
+            "ice_time": "36000",
+            "saves": "250",
+            "shots": "270",
+            "goals_against": "20",
+            "wins": "6",
+            "losses": "3",
+            "ot_losses": "1"
+        }
+    ]
+}
+
+
+def _fixture(data):
+    """Get a fresh copy of a fixture, nested lists and dicts included."""
+    return deepcopy(data)
+
+
+def _lineup(skater_id, goalie_id):
+    # One skater and one goalie for a team
+    return {
+        "players": [
+            {"player_id": skater_id, "jersey_number": "9", "position_str": "F", "rookie": "0",
+             "start": "1", "status": "", "goals": "1", "plusminus": "+1"},
+            {"player_id": goalie_id, "position_str": "G"}
+        ],
+        "goalies": [
+            {"player_id": goalie_id, "jersey_number": "30", "position_str": "G", "rookie": "0",
+             "start": "1", "status": "W", "seconds": "3600", "time": "60:00", "saves": "20"}
+        ]
+    }
+
+
+_GAME_STATS_FIXTURE = {
+    "meta": {"season_id": "5", "home_team": "1", "visiting_team": "2",
+             "home_goal_count": "3", "visiting_goal_count": "2"},
+    "shotsByPeriod": {"home": {"1": "10", "2": "5", "3": "7"}, "visitor": {"1": "8", "2": "6", "3": "4"}},
+    "powerPlayCount": {"home": "2", "visitor": "3"},
+    "powerPlayGoals": {"home": "1", "visitor": "0"},
+    "totalFaceoffs": {"home": {"won": "20"}, "visitor": {"won": "25"}},
+    "totalHits": {"home": "11", "visitor": "12"},
+    "home_team_lineup": _lineup("101", "102"),
+    "visitor_team_lineup": _lineup("201", "202")
+}
 
 
 class TestScrapers(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # Patch the basic_info dependencies once for the whole class
+        cls._patchers = [
+            patch('pwhl_scraper.scrapers.basic_info.create_connection'),
+            patch('pwhl_scraper.scrapers.basic_info.PWHLApiClient')
+        ]
+        cls.mock_create_connection, cls.mock_api_client_class = (p.start() for p in cls._patchers)
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in reversed(cls._patchers):
+            patcher.stop()
+
     def setUp(self):
-        # Create a mock connection for database operations
-        self.mock_conn = MagicMock()
-        self.mock_cursor = MagicMock()
-        self.mock_conn.cursor.return_value = self.mock_cursor
+        # Real in-memory database with the full schema; foreign keys stay off
+        # since each test writes one table without its parent rows
+        self.conn = clone_template(sqlite3.connect(":memory:"))
+
+        # Reuse the class mocks, clearing the calls recorded by earlier tests
+        for mock in (self.mock_create_connection, self.mock_api_client_class):
+            mock.reset_mock()
+
+    def tearDown(self):
+        self.conn.close()
 
-        # Create a mock API client
-        self.mock_client = MagicMock(spec=PWHLApiClient)
+    def _count(self, table):
+        return fetch_one(self.conn, f"SELECT COUNT(*) FROM {table}")[0]
+
+    def test_update_leagues(self):
+        from pwhl_scraper.scrapers.basic_info import update_leagues
 
-    @patch('pwhl_scraper.scrapers.basic_info.create_connection')
-    @patch('pwhl_scraper.scrapers.basic_info.PWHLApiClient')
-    def test_update_leagues(self, mock_api_client_class, mock_create_connection):
         # Setup mock client and connection
         mock_api_client = MagicMock()
-        mock_api_client_class.return_value = mock_api_client
-        mock_create_connection.return_value = self.mock_conn
+        self.mock_api_client_class.return_value = mock_api_client
+        self.mock_create_connection.return_value = self.conn
 
         # Mock API response
-        mock_api_client.fetch_basic_info.return_value = {
-            "current_league_id": "1",
-            "leagues": [
-                {
-                    "id": "1",
-                    "name": "Professional Women's Hockey League",
-                    "short_name": "PWHL",
-                    "code": "pwhl",
-                    "logo_image": "https://example.com/logo.png"
-                }
-            ]
-        }
-
-        # Mock cursor.fetchall to return empty list (no existing leagues)
-        self.mock_cursor.fetchall.return_value = []
+        mock_api_client.fetch_basic_info.return_value = _fixture(_LEAGUES_RESPONSE)
 
         # Call the function
-        result = update_leagues(self.mock_conn, [
-            {
-                "id": "1",
-                "name": "Professional Women's Hockey League",
-                "short_name": "PWHL",
-                "code": "pwhl",
-                "logo_image": "https://example.com/logo.png"
-            }
-        ])
+        result = update_leagues(self.conn, [_fixture(_LEAGUE_FIXTURE)])
 
         # Assertions
         self.assertEqual(result, 1)  # One league updated
-        self.mock_cursor.executemany.assert_called_once()  # Insert was called
+        self.assertEqual(fetch_one(self.conn, "SELECT code FROM leagues WHERE id = 1")[0], "pwhl")
 
     def test_update_teams(self):
-        # Mock fetchone to simulate no existing teams
-        self.mock_cursor.fetchone.return_value = None
-
-        # Test data
-        teams_data = [
-            {
-                "id": "1",
-                "name": "Toronto",
-                "nickname": "Toronto",
-                "code": "TOR",
-                "city": "Toronto",
-                "team_logo_url": "https://example.com/toronto.png",
-                "division_id": "1"
-            }
-        ]
+        from pwhl_scraper.scrapers.basic_info import update_teams
 
         # Call the function
-        result = update_teams(self.mock_conn, teams_data, 5, 1)
+        result = update_teams(self.conn, _fixture(_TEAMS_FIXTURE), 5, 1)
 
         # Assertions
         self.assertEqual(result, 1)  # One team updated
-        self.mock_cursor.execute.assert_called()  # Database was queried
+        self.assertEqual(fetch_one(self.conn, "SELECT code FROM teams WHERE id = 1")[0], "TOR")
 
     def test_update_player(self):
-        # Mock fetchone to simulate no existing player
-        self.mock_cursor.fetchone.return_value = None
-
-        # Player data
-        player_data = {
-            "player_id": "123",
-            "first_name": "Jane",
-            "last_name": "Smith",
-            "tp_jersey_number": "23",
-            "active": "1",
-            "rookie": "0",
-            "position_id": "3",
-            "position": "D",
-            "height": "5'9\"",
-            "weight": "150",
-            "birthdate": "1997-05-15",
-            "shoots": "L",
-            "catches": "",
-            "player_image": "https://example.com/jane.jpg",
-            "birthtown": "Toronto",
-            "birthprov": "ON",
-            "birthcntry": "CAN",
-            "latest_team_id": "1"
-        }
+        from pwhl_scraper.scrapers.players import update_player
 
         # Call the function
-        result = update_player(self.mock_conn, player_data)
+        result = update_player(self.conn, _fixture(_PLAYER_FIXTURE))
 
         # Assertions
         self.assertEqual(result, 1)  # One player updated
-        self.mock_cursor.execute.assert_called()  # Database was queried
+        self.assertEqual(fetch_one(self.conn, "SELECT last_name FROM players WHERE id = 123")[0], "Smith")
 
     def test_update_season_stats_teams(self):
-        # Mock fetchone to simulate no existing stats
-        self.mock_cursor.fetchone.return_value = None
-
-        # Team stats data
-        team_stats = [
-            {
-                "team_id": "1",
-                "division_id": "1",
-                "wins": "10",
-                "losses": "5",
-                "ties": "0",
-                "ot_losses": "2",
-                "points": "22",
-                "goals_for": "45",
-                "goals_against": "35"
-            }
-        ]
+        from pwhl_scraper.scrapers.stats import update_season_stats_teams
 
         # Call the function
-        result = update_season_stats_teams(self.mock_conn, 5, team_stats)
+        result = update_season_stats_teams(self.conn, 5, _fixture(_TEAM_STATS_FIXTURE))
 
         # Assertions
         self.assertEqual(result, 1)  # One team stats record updated
-        self.mock_cursor.execute.assert_called()  # Database was queried
+        self.assertEqual(
+            fetch_one(self.conn, "SELECT wins FROM season_stats_teams WHERE season_id = 5 AND team_id = 1")[0], 10)
+
+    def test_update_season_stats_goalies(self):
+        from pwhl_scraper.scrapers.stats import update_season_stats_goalies
+
+        def stored():
+            return fetch_one(self.conn, "SELECT saves, row_hash FROM season_stats_goalies "
+                                        "WHERE player_id = 102 AND season_id = 5")
+
+        # The first write stores the row, an identical re-scrape writes nothing
+        self.assertEqual(update_season_stats_goalies(self.conn, 102, _fixture(_GOALIE_SEASON_STATS_FIXTURE)), 1)
+        saves, row_hash = stored()
+        self.assertEqual(saves, 250)
+        self.assertEqual(update_season_stats_goalies(self.conn, 102, _fixture(_GOALIE_SEASON_STATS_FIXTURE)), 0)
+
+        # A changed stat is written again along with its new fingerprint
+        changed = _fixture(_GOALIE_SEASON_STATS_FIXTURE)
+        changed["regular"][0]["saves"] = "260"
+        self.assertEqual(update_season_stats_goalies(self.conn, 102, changed), 1)
+        new_saves, new_row_hash = stored()
+        self.assertEqual(new_saves, 260)
+        self.assertNotEqual(new_row_hash, row_hash)
+
+    def test_in_savepoint(self):
+        from pwhl_scraper.scrapers.stats import _in_savepoint
+
+        def write(league_id, fail=False):
+            def run():
+                self.conn.execute("INSERT INTO leagues (id, name) VALUES (?, ?)", (league_id, "League"))
+                if fail:
+                    raise sqlite3.Error("write failed")
+                return 1
+            return run
+
+        # A failing write is rolled back alone, keeping the uncommitted write before it
+        self.assertEqual(_in_savepoint(self.conn, write(1)), 1)
+        self.assertEqual(_in_savepoint(self.conn, write(2, fail=True)), 0)
+        self.conn.commit()
+
+        self.assertEqual(fetch_all(self.conn, "SELECT id FROM leagues ORDER BY id"), [(1,)])
+
+    def test_update_game_stats_all(self):
+        from pwhl_scraper.scrapers.stats import update_game_stats_all
+
+        # Call the function
+        result = update_game_stats_all(self.conn, 900, _fixture(_GAME_STATS_FIXTURE))
+
+        # Assertions
+        self.assertEqual(result, 6)  # Two team, two skater and two goalie records
+        self.assertEqual(self._count("game_stats_teams"), 2)
+        self.assertEqual(self._count("game_stats_skaters"), 2)
+        self.assertEqual(self._count("game_stats_goalies"), 2)
 
 
 if __name__ == '__main__':